@@ -699,6 +699,8 @@ async def generate_mode(
             model=effective_model,
             api_key=effective_api_key,
             base_url=(user_llm_base_url if user_llm_access_mode == "custom_openai" else None),
+            cache_scope=(str(user_id) if user_id is not None else None),
+            regenerate=bool(body.get("regenerate")),
         )
         # 成功后扣费（仅平台 Key，root 用户豁免）
         if _billing_enabled() and quota_user_id is not None and not using_user_key:
@@ -102,10 +102,15 @@ async def render(
                     with Image.open(io.BytesIO(pushed_payload["image"])) as pushed_img:
                         if params.colors >= 3 and pushed_img.mode == "P":
                             img = pushed_img.copy()
+                            if img.size != (params.w, params.h):
+                                img = img.resize((params.w, params.h), Image.NEAREST)
                         else:
-                            img = pushed_img.convert("1")
-                        if img.size != (params.w, params.h):
-                            img = img.resize((params.w, params.h), Image.NEAREST)
+                            # Scale the grayscale first so the error-diffusion
+                            # pass only touches the device's pixels.
+                            img = pushed_img.convert("L")
+                            if img.size != (params.w, params.h):
+                                img = img.resize((params.w, params.h), Image.BILINEAR)
+                            img = img.convert("1")
                     if params.colors >= 3 and img.mode == "P":
                         out_bytes = image_to_raw_2bpp(img)
                         out_media = "application/octet-stream"
@@ -19,7 +19,7 @@ from dotenv import load_dotenv
 from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
 from PIL import Image, ImageDraw, ImageFont
-from core.patterns.utils import load_font
+from core.patterns.utils import load_font, text_bbox
 
 try:  # pragma: no cover - exercised implicitly at import time
     from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -83,6 +83,8 @@ from core.context import calc_battery_pct, extract_location_settings, get_date_c
 from core.pipeline import generate_and_render, get_effective_mode_config
 from core.renderer import image_to_bmp_bytes
 from core.stats_store import (
+    close_stats_db,
+    flush_render_logs,
     get_latest_battery_voltage,
     init_stats_db,
     log_heartbeat,
@@ -108,10 +110,16 @@ async def lifespan(app):
     await init_db()
     await init_stats_db()
     from core.cache import init_cache_db
+    from core.content import close_llm_clients
     from core.db import close_all
+    from core.json_content import close_prefetch_clients
 
     await init_cache_db()
     yield
+    await flush_render_logs()
+    await close_stats_db()
+    await close_prefetch_clients()
+    await close_llm_clients()
     await close_all()
 
 
@@ -1157,10 +1165,12 @@ async def validate_firmware_url(url: str) -> dict:
 
 def normalize_pushed_preview(image_bytes: bytes, *, width: int, height: int) -> bytes:
     with Image.open(io.BytesIO(image_bytes)) as incoming:
-        img = incoming.convert("1")
+        # JPEG uploads decode at a reduced DCT scale straight to grayscale.
+        incoming.draft("L", (width, height))
+        img = incoming.convert("L")
         if img.size != (width, height):
-            img = img.resize((width, height), Image.NEAREST)
-        return image_to_bmp_bytes(img)
+            img = img.resize((width, height), Image.BILINEAR)
+        return image_to_bmp_bytes(img.convert("1"))
 
 
 def _render_api_key_invalid_image(screen_w: int, screen_h: int) -> Image.Image:
@@ -1177,7 +1187,7 @@ def _render_api_key_invalid_image(screen_w: int, screen_h: int) -> Image.Image:
         font = None
     try:
         if font:
-            bbox = draw.textbbox((0, 0), message, font=font)
+            bbox = text_bbox(font, message, draw.fontmode)
             text_w = bbox[2] - bbox[0]
             text_h = bbox[3] - bbox[1]
         else:
@@ -1205,7 +1215,7 @@ def _render_quota_exhausted_image(screen_w: int, screen_h: int) -> Image.Image:
         font = None
     try:
         if font:
-            bbox = draw.textbbox((0, 0), message, font=font)
+            bbox = text_bbox(font, message, draw.fontmode)
             text_w = bbox[2] - bbox[0]
             text_h = bbox[3] - bbox[1]
         else:
@@ -1233,15 +1243,15 @@ def _render_device_unbound_image(screen_w: int, screen_h: int, pair_code: str) -
         body_font = None
     try:
         if title_font:
-            title_bbox = draw.textbbox((0, 0), title, font=title_font)
+            title_bbox = text_bbox(title_font, title, draw.fontmode)
             title_w = title_bbox[2] - title_bbox[0]
             title_h = title_bbox[3] - title_bbox[1]
         else:
             title_w = len(title) * 10
             title_h = 18
         if body_font:
-            pair_bbox = draw.textbbox((0, 0), pair_line, font=body_font)
-            hint_bbox = draw.textbbox((0, 0), hint, font=body_font)
+            pair_bbox = text_bbox(body_font, pair_line, draw.fontmode)
+            hint_bbox = text_bbox(body_font, hint, draw.fontmode)
             pair_w = pair_bbox[2] - pair_bbox[0]
             pair_h = pair_bbox[3] - pair_bbox[1]
             hint_w = hint_bbox[2] - hint_bbox[0]
@@ -236,10 +236,29 @@ class ContentCache:
         battery_pct = calc_battery_pct(v)
         date_ctx = await get_date_context()
 
+        # Modes usually share the device location; fetch each distinct one once
+        locations = {
+            persona: extract_location_settings(get_effective_mode_config(config, persona))
+            for persona in modes
+        }
+        unique_locations = {tuple(sorted(loc.items())): loc for loc in locations.values()}
+        fetched = await asyncio.gather(
+            *(get_weather(**loc) for loc in unique_locations.values()),
+            return_exceptions=True,
+        )
+        weather_by_location = {
+            key: weather
+            for key, weather in zip(unique_locations, fetched)
+            if isinstance(weather, dict)
+        }
+
         tasks = [
             self._render_single_mode_for_batch(
                 mac, persona, battery_pct, copy.deepcopy(config), copy.deepcopy(date_ctx),
                 screen_w, screen_h, colors=colors,
+                weather=copy.deepcopy(
+                    weather_by_location.get(tuple(sorted(locations[persona].items())))
+                ),
             )
             for persona in modes
         ]
@@ -281,11 +300,13 @@ class ContentCache:
         screen_w: int = SCREEN_WIDTH,
         screen_h: int = SCREEN_HEIGHT,
         colors: int = 2,
+        weather: dict | None = None,
     ) -> tuple[str, Image.Image] | None:
         try:
             logger.info(f"[CACHE] Generating {mac}:{persona}...")
-            effective_cfg = get_effective_mode_config(config, persona)
-            weather = await get_weather(**extract_location_settings(effective_cfg))
+            if weather is None:
+                effective_cfg = get_effective_mode_config(config, persona)
+                weather = await get_weather(**extract_location_settings(effective_cfg))
 
             img, _content = await generate_and_render(
                 persona, config, date_ctx, weather, battery_pct,
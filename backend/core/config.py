@@ -359,24 +359,24 @@ _BUILTIN_MODE_IDS = {
 }
 
 
-def get_supported_modes() -> set[str]:
+def get_supported_modes() -> frozenset[str]:
     """Get all supported mode IDs from the registry (with fallback)."""
     try:
         from .mode_registry import get_registry
         return get_registry().get_supported_ids()
     except (ImportError, AttributeError, RuntimeError):
         logger.warning("[Config] Falling back to builtin supported modes", exc_info=True)
-        return _BUILTIN_MODE_IDS
+        return frozenset(_BUILTIN_MODE_IDS)
 
 
-def get_cacheable_modes() -> set[str]:
+def get_cacheable_modes() -> frozenset[str]:
     """Get cacheable mode IDs from the registry (with fallback)."""
     try:
         from .mode_registry import get_registry
         return get_registry().get_cacheable_ids()
     except (ImportError, AttributeError, RuntimeError):
         logger.warning("[Config] Falling back to builtin cacheable modes", exc_info=True)
-        return {"STOIC", "ROAST", "ZEN", "DAILY"}
+        return frozenset({"STOIC", "ROAST", "ZEN", "DAILY"})
 
 
 from typing import Optional
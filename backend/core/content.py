@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import json
 import os
 import re
+import weakref
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
 
 import logging
 import httpx
@@ -200,6 +203,71 @@ def _build_style_instructions(
     return "\n额外风格要求：" + "；".join(parts) + "。"
 
 
+# AsyncOpenAI clients own an httpx connection pool; share one per
+# (event loop, api_key, base_url) so repeat calls reuse warm TLS connections.
+_LLM_CLIENT_CACHE_SIZE = 32
+_LLM_MAX_CONCURRENCY = 8
+_llm_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_llm_slots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_llm_closing: set[asyncio.Task] = set()
+
+
+def _shared_openai_client(api_key: str, base_url: str) -> AsyncOpenAI:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return AsyncOpenAI(api_key=api_key, base_url=base_url)
+    clients = _llm_clients.get(loop)
+    if clients is None:
+        clients = _llm_clients[loop] = OrderedDict()
+    key = (api_key, base_url)
+    client = clients.get(key)
+    if client is None:
+        client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        clients[key] = client
+        if len(clients) > _LLM_CLIENT_CACHE_SIZE:
+            _, evicted = clients.popitem(last=False)
+            task = loop.create_task(_close_llm_client(evicted))
+            _llm_closing.add(task)
+            task.add_done_callback(_llm_closing.discard)
+    else:
+        clients.move_to_end(key)
+    return client
+
+
+async def _close_llm_client(client: AsyncOpenAI) -> None:
+    """Close a client's connection pool once its in-flight calls finish."""
+    slot = _llm_slot(client)
+    for _ in range(_LLM_MAX_CONCURRENCY):
+        await slot.acquire()
+    try:
+        await client.close()
+    except Exception:
+        logger.warning("[LLM] Failed to close evicted client", exc_info=True)
+
+
+async def close_llm_clients() -> None:
+    """Close the shared LLM clients of the running loop (app shutdown)."""
+    loop = asyncio.get_running_loop()
+    clients = _llm_clients.pop(loop, None)
+    pending = [task for task in _llm_closing if task.get_loop() is loop]
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    for client in (clients or {}).values():
+        try:
+            await client.close()
+        except Exception:
+            logger.warning("[LLM] Failed to close client", exc_info=True)
+
+
+def _llm_slot(client: AsyncOpenAI) -> asyncio.Semaphore:
+    """Bound concurrent requests per shared client (one API key + endpoint)."""
+    slot = _llm_slots.get(client)
+    if slot is None:
+        slot = _llm_slots[client] = asyncio.Semaphore(_LLM_MAX_CONCURRENCY)
+    return slot
+
+
 def _get_client(
     provider: str = "deepseek", model: str = "deepseek-chat",
     api_key: str | None = None,
@@ -244,7 +312,7 @@ def _get_client(
     model_config = config["models"].get(model, {"max_tokens": 120})
     max_tokens = model_config["max_tokens"]
 
-    return AsyncOpenAI(api_key=api_key, base_url=resolved_base_url), max_tokens
+    return _shared_openai_client(api_key, resolved_base_url), max_tokens
 
 
 class LLMClient:
@@ -282,9 +350,10 @@ class LLMClient:
         extra_body = _chat_completion_extra_body(self.provider, self.model)
         if extra_body is not None:
             request_kwargs["extra_body"] = extra_body
-        response = await self._client.chat.completions.create(
-            **request_kwargs,
-        )
+        async with _llm_slot(self._client):
+            response = await self._client.chat.completions.create(
+                **request_kwargs,
+            )
         text = response.choices[0].message.content.strip()
         finish_reason = response.choices[0].finish_reason
         usage = response.usage
@@ -334,9 +403,10 @@ async def _call_llm(
     extra_body = _chat_completion_extra_body(provider, model)
     if extra_body is not None:
         request_kwargs["extra_body"] = extra_body
-    response = await client.chat.completions.create(
-        **request_kwargs,
-    )
+    async with _llm_slot(client):
+        response = await client.chat.completions.create(
+            **request_kwargs,
+        )
     text = response.choices[0].message.content.strip()
 
     finish_reason = response.choices[0].finish_reason
@@ -454,8 +524,6 @@ def _fallback_content(persona: str) -> dict:
 
 async def fetch_hn_top_stories(limit: int = 3) -> list[dict]:
     """获取 Hacker News 热榜 Top N（并发请求各 story）"""
-    import asyncio as _asyncio
-
     try:
         async with httpx.AsyncClient(timeout=10.0) as client:
             resp = await client.get(
@@ -480,7 +548,7 @@ async def fetch_hn_top_stories(limit: int = 3) -> list[dict]:
                     }
                 return None
 
-            results = await _asyncio.gather(*[_fetch_one(sid) for sid in story_ids])
+            results = await asyncio.gather(*[_fetch_one(sid) for sid in story_ids])
             stories = [s for s in results if s is not None]
 
             logger.info(f"[HN] Fetched {len(stories)} stories (concurrent)")
@@ -755,12 +823,11 @@ async def generate_briefing_content(
         llm_model = ctx.llm_model
         api_key = ctx.api_key
     language = getattr(ctx, "language", "zh") if ctx is not None else "zh"
-    import asyncio as _asyncio
 
     logger.info("[BRIEFING] Starting content generation...")
 
     # Fetch HN, PH, and V2EX concurrently
-    hn_stories, ph_product, v2ex_topics = await _asyncio.gather(
+    hn_stories, ph_product, v2ex_topics = await asyncio.gather(
         fetch_hn_top_stories(limit=2),
         fetch_ph_top_product(),
         fetch_v2ex_hot(limit=1),
@@ -783,7 +850,7 @@ async def generate_briefing_content(
 
     if summarize:
         llm_base_url = _extract_llm_base_url(ctx)
-        (hn_stories, ph_product), insight = await _asyncio.gather(
+        (hn_stories, ph_product), insight = await asyncio.gather(
             summarize_briefing_content(
                 hn_stories, ph_product, llm_provider, llm_model, api_key=api_key, llm_base_url=llm_base_url, language=language
             ),
@@ -1094,14 +1161,12 @@ Requirements:
                 "prompt": image_prompt,
             }
 
-        import asyncio as _asyncio
-
         dashscope.base_http_api_url = "https://dashscope.aliyuncs.com/api/v1"
 
         messages = [{"role": "user", "content": [{"text": image_prompt}]}]
 
         # Wrap synchronous DashScope SDK call to avoid blocking the event loop
-        response = await _asyncio.to_thread(
+        response = await asyncio.to_thread(
             MultiModalConversation.call,
             api_key=api_key,
             model=image_model,
@@ -27,6 +27,10 @@ class _ManagedConnection:
     def __getattr__(self, name):
         return getattr(self._conn, name)
 
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
     async def close(self):
         if self._closed:
             return
@@ -4,10 +4,12 @@
 """
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
 import random
+import weakref
 from json import JSONDecodeError
 from pathlib import Path
 from typing import Any
@@ -39,6 +41,28 @@ DEDUP_MAX_RETRIES = 2
 _BACKEND_ROOT = Path(__file__).resolve().parent.parent
 _UPLOAD_DIR = _BACKEND_ROOT / "runtime_uploads"
 
+# Image prefetches hit the same few hosts render after render; keep one pooled
+# client per event loop so keep-alive connections and TLS sessions are reused.
+_PREFETCH_LIMITS = httpx.Limits(max_keepalive_connections=4, max_connections=8)
+_prefetch_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _prefetch_client() -> httpx.AsyncClient:
+    """Return the pooled image-prefetch client bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _prefetch_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=12.0, follow_redirects=True, limits=_PREFETCH_LIMITS)
+        _prefetch_clients[loop] = client
+    return client
+
+
+async def close_prefetch_clients() -> None:
+    """Close the image-prefetch client of the running event loop (app shutdown)."""
+    client = _prefetch_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 def _resolve_uploaded_image_bytes(url: str) -> bytes | None:
     try:
@@ -84,20 +108,32 @@ async def _prefetch_images(content: dict, mode_def: dict) -> dict:
     if not image_fields:
         return content
 
-    async with httpx.AsyncClient(timeout=12.0, follow_redirects=True) as client:
-        for field_name in image_fields:
-            url = content.get(field_name)
-            if url and isinstance(url, str) and url.startswith("http"):
-                local_bytes = _resolve_uploaded_image_bytes(url)
-                if local_bytes:
-                    content[f"_prefetched_{field_name}"] = local_bytes
-                    continue
-                try:
-                    resp = await client.get(url)
-                    if resp.status_code < 400:
-                        content[f"_prefetched_{field_name}"] = resp.content
-                except httpx.HTTPError:
-                    logger.warning("[JSONContent] Failed to prefetch image field %s", field_name, exc_info=True)
+    pending: list[tuple[str, str]] = []
+    for field_name in image_fields:
+        url = content.get(field_name)
+        if url and isinstance(url, str) and url.startswith("http"):
+            local_bytes = _resolve_uploaded_image_bytes(url)
+            if local_bytes:
+                content[f"_prefetched_{field_name}"] = local_bytes
+            else:
+                pending.append((field_name, url))
+
+    if not pending:
+        return content
+
+    # Fetch all remote images concurrently so total latency is the slowest
+    # single download rather than the sum of them.
+    client = _prefetch_client()
+    results = await asyncio.gather(
+        *(client.get(url) for _, url in pending), return_exceptions=True
+    )
+    for (field_name, _), resp in zip(pending, results):
+        if isinstance(resp, httpx.HTTPError):
+            logger.warning("[JSONContent] Failed to prefetch image field %s", field_name, exc_info=resp)
+        elif isinstance(resp, BaseException):
+            raise resp
+        elif resp.status_code < 400:
+            content[f"_prefetched_{field_name}"] = resp.content
     return content
 
 
@@ -880,8 +916,7 @@ async def _generate_external_data_content(mode_def: dict, content_cfg: dict, fal
         summarize = bool(content_cfg.get("summarize", True))
         include_insight = bool(content_cfg.get("include_insight", True))
 
-        import asyncio as _asyncio
-        hn_items, ph_item, v2ex_items = await _asyncio.gather(
+        hn_items, ph_item, v2ex_items = await asyncio.gather(
             fetch_hn_top_stories(limit=hn_limit),
             fetch_ph_top_product(),
             fetch_v2ex_hot(limit=v2ex_limit),
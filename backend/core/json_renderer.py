@@ -4,9 +4,15 @@
 """
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -25,11 +31,15 @@ from .patterns.utils import (
     draw_status_bar,
     draw_footer,
     draw_dashed_line,
+    get_weather_icon,
     load_font,
     load_font_by_name,
+    status_bar_hour,
     paste_icon_onto,
     load_icon,
     wrap_text,
+    wrap_text_balanced,
+    text_bbox,
     has_cjk,
 )
 from .mode_catalog import builtin_catalog_map
@@ -44,9 +54,34 @@ _PALETTE_RGB = {
     2: (232, 176, 0),
     3: (200, 0, 0),
 }
+# Full 256-entry palette for "P" canvases, built once instead of per image.
+_EINK_PALETTE_BYTES = bytes(EINK_4COLOR_PALETTE + [0] * (768 - len(EINK_4COLOR_PALETTE)))
 
 STATUS_BAR_BOTTOM_DEFAULT = 36  # Used when screen_h unknown (e.g. dataclass default)
 
+_IMAGE_FETCH_ATTEMPTS = (
+    {"trust_env": True, "timeout": httpx.Timeout(connect=8.0, read=12.0, write=8.0, pool=8.0)},
+    {"trust_env": False, "timeout": httpx.Timeout(connect=12.0, read=18.0, write=10.0, pool=10.0)},
+)
+# Image blocks fetch one or two URLs per render; keep a few warm connections
+# per pooled client rather than httpx's defaults sized for crawlers.
+_IMAGE_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=4, max_connections=8)
+# Large non-JPEG sources (draft() only helps JPEG) are box-reduced by integer
+# factors before the final bicubic pass; 3.0 is visually indistinguishable.
+_IMAGE_REDUCING_GAP = 3.0
+_image_clients: dict[bool, httpx.Client] = {}
+_image_clients_lock = threading.Lock()
+
+# Rendering is a pure function of its inputs; refreshes whose content, layout
+# and status-bar values are unchanged reuse the previous frame. Entries are
+# keyed by mode id and status-bar arguments and hold (mode_def, content, frame);
+# the definition and content are compared by equality on lookup.
+_RENDER_MEMO_SIZE = 8
+_render_memo: OrderedDict[tuple, tuple[dict, dict, Image.Image]] = OrderedDict()
+_render_memo_lock = threading.Lock()
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
 _EMOJI_PATTERN = re.compile(
     r"[\U0001F300-\U0001F9FF\u2600-\u26FF\u2700-\u27BF]+", re.UNICODE
 )
@@ -131,16 +166,32 @@ def _localized_footer_attribution(mode_id: str, attribution: str, language: str)
     return localized or attribution
 
 
-def _convert_image_block(src: Image.Image, width: int, height: int, colors: int) -> Image.Image:
-    resized = src.convert("RGBA").resize((width, height))
+def _convert_image_block(
+    src: Image.Image, width: int, height: int, colors: int, dither: bool = True,
+) -> Image.Image:
+    # Mono panels get Pillow's C Floyd-Steinberg by default, which photographic
+    # sources need; ``dither=False`` thresholds instead (line art, QR codes).
+    mono_dither = Image.Dither.FLOYDSTEINBERG if dither else Image.Dither.NONE
+    if colors < 3 and src.mode == "1" and src.size == (width, height):
+        return src
+    # JPEG sources decode at the smallest 1/2-1/8 DCT scale that still covers
+    # the target (and straight to grayscale for mono); no-op for other formats.
+    src.draft("L" if colors < 3 else None, (width, height))
+    if colors < 3 and src.mode in ("1", "L", "RGB"):
+        # Opaque source: resize a single gray channel and convert in one
+        # C pass instead of compositing over white first.
+        gray = src.convert("L")
+        if gray.size != (width, height):
+            gray = gray.resize((width, height), reducing_gap=_IMAGE_REDUCING_GAP)
+        return gray.convert("1", dither=mono_dither)
+    resized = src.convert("RGBA").resize((width, height), reducing_gap=_IMAGE_REDUCING_GAP)
     base = Image.new("RGBA", resized.size, (255, 255, 255, 255))
     base.alpha_composite(resized)
     rgb = base.convert("RGB")
     if colors < 3:
-        return rgb.convert("L").convert("1")
+        return rgb.convert("L").convert("1", dither=mono_dither)
     out = Image.new("P", rgb.size, EINK_BG)
-    pal = EINK_4COLOR_PALETTE + [0] * (768 - len(EINK_4COLOR_PALETTE))
-    out.putpalette(pal)
+    out.putpalette(_EINK_PALETTE_BYTES)
     allowed = (0, 1, 3) if colors == 3 else (0, 1, 2, 3)
     cache: dict[tuple[int, int, int], int] = {}
     mapped: list[int] = []
@@ -174,27 +225,26 @@ class RenderContext:
     available_width: int = SCREEN_WIDTH
     footer_height: int = 30
     colors: int = 2
-
-    @property
-    def scale(self) -> float:
-        return self.screen_w / 400.0
-
-    @property
-    def h_scale(self) -> float:
-        return self.screen_h / 300.0
-
-    @property
-    def min_scale(self) -> float:
-        """Conservative scale factor based on the more constrained dimension."""
-        return min(self.scale, self.h_scale)
+    # Derived from the screen geometry once; constant for the whole render.
+    scale: float = field(init=False, repr=False)
+    h_scale: float = field(init=False, repr=False)
+    min_scale: float = field(init=False, repr=False)  # more constrained dimension
+    footer_top: int = field(init=False, repr=False)
+    margin_x: int = field(init=False, repr=False)  # default 6% side margin
+    wide_margin_x: int = field(init=False, repr=False)  # default 8% side margin
+    # Set when a block fetched over the network or drew a placeholder; such
+    # frames depend on more than the render inputs and are not memoized.
+    degraded: bool = False
 
     def __post_init__(self):
         if self.available_width == SCREEN_WIDTH and self.screen_w != SCREEN_WIDTH:
             self.available_width = self.screen_w
-
-    @property
-    def footer_top(self) -> int:
-        return self.screen_h - self.footer_height
+        self.scale = self.screen_w / 400.0
+        self.h_scale = self.screen_h / 300.0
+        self.min_scale = min(self.scale, self.h_scale)
+        self.footer_top = self.screen_h - self.footer_height
+        self.margin_x = int(self.screen_w * 0.06)
+        self.wide_margin_x = int(self.screen_w * 0.08)
 
     def resolve(self, template: str) -> str:
         """Resolve {field} placeholders against content dict."""
@@ -204,7 +254,11 @@ class RenderContext:
             if isinstance(val, list):
                 return ", ".join(str(v) for v in val)
             return str(val)
-        return re.sub(r"\{(\w+)\}", _replace, template)
+        return _PLACEHOLDER_RE.sub(_replace, template)
+
+    def block_margin_x(self, raw: Any, default: int) -> int:
+        """Scale a block's explicit margin_x, or fall back to a precomputed default."""
+        return int(raw * self.scale) if raw is not None else default
 
     def get_field(self, name: str) -> Any:
         return self.content.get(name, "")
@@ -232,6 +286,65 @@ class RenderContext:
         paste_icon_onto(self.img, icon, pos, fill)
 
 
+def _image_client(trust_env: bool, timeout: httpx.Timeout) -> httpx.Client:
+    """Return a pooled client for image fetches so keep-alive connections are reused."""
+    client = _image_clients.get(trust_env)
+    if client is None:
+        with _image_clients_lock:
+            client = _image_clients.get(trust_env)
+            if client is None:
+                client = httpx.Client(
+                    timeout=timeout, follow_redirects=True, trust_env=trust_env,
+                    limits=_IMAGE_CLIENT_LIMITS,
+                )
+                _image_clients[trust_env] = client
+    return client
+
+
+@atexit.register
+def _close_image_clients() -> None:
+    for client in _image_clients.values():
+        client.close()
+    _image_clients.clear()
+
+
+def _new_canvas(width: int, height: int, colors: int) -> Image.Image:
+    """Blank e-ink canvas: 1-bit, or palette mode for 3/4-color panels."""
+    if colors >= 3:
+        img = Image.new("P", (width, height), EINK_BG)
+        img.putpalette(_EINK_PALETTE_BYTES)
+        return img
+    return Image.new("1", (width, height), EINK_BG)
+
+
+_PALETTE_INK_LUT = [0 if i == EINK_BG else 255 for i in range(256)]
+_MONO_INK_LUT = [255 if i < 128 else 0 for i in range(256)]
+
+
+def _ink_mask(img: Image.Image) -> Image.Image:
+    """1-bit mask selecting every pixel that is not background."""
+    if img.mode == "P":
+        return img.point(_PALETTE_INK_LUT, "1")
+    return img.convert("L").point(_MONO_INK_LUT, "1")
+
+
+def _has_absolute_y(blocks: list) -> bool:
+    """True if any block (recursively) pins itself to an explicit y coordinate."""
+    for block in blocks:
+        if not isinstance(block, dict):
+            continue
+        if "y" in block:
+            return True
+        for key in ("children", "blocks", "left", "right", "fallback_children"):
+            nested = block.get(key)
+            if isinstance(nested, list) and _has_absolute_y(nested):
+                return True
+        for cond in block.get("conditions") or []:
+            if isinstance(cond, dict) and _has_absolute_y(cond.get("children") or []):
+                return True
+    return False
+
+
 # ── Public API ───────────────────────────────────────────────
 
 
@@ -250,12 +363,53 @@ def render_json_mode(
     language: str = "zh",
 ) -> Image.Image:
     """Render a JSON-defined mode to an e-ink image (1-bit or 4-color palette)."""
-    if colors >= 3:
-        img = Image.new("P", (screen_w, screen_h), EINK_BG)
-        pal = EINK_4COLOR_PALETTE + [0] * (768 - len(EINK_4COLOR_PALETTE))
-        img.putpalette(pal)
-    else:
-        img = Image.new("1", (screen_w, screen_h), EINK_BG)
+    # The status bar only shows the hour's period label, so resolve the hour
+    # once (wall clock when time_str is empty) and key and render on it alone.
+    hour = status_bar_hour(time_str)
+    args = {
+        "date_str": date_str, "weather_str": weather_str, "battery_pct": battery_pct,
+        "weather_code": weather_code, "time_str": f"{hour:02d}:00", "screen_w": screen_w,
+        "screen_h": screen_h, "colors": colors, "language": language,
+    }
+    key = (mode_def.get("mode_id", ""), *args.values())
+    with _render_memo_lock:
+        entry = _render_memo.get(key)
+        if entry is not None and entry[0] == mode_def and entry[1] == content:
+            _render_memo.move_to_end(key)
+            return entry[2].copy()
+    img, degraded = _render_json_mode(mode_def, content, **args)
+    if degraded:
+        # Frames with network-fetched or placeholder images are not a pure
+        # function of the inputs; a transient failure must not stick.
+        return img
+    try:
+        entry = (copy.deepcopy(mode_def), copy.deepcopy(content), img.copy())
+    except (TypeError, copy.Error):
+        return img
+    with _render_memo_lock:
+        _render_memo[key] = entry
+        _render_memo.move_to_end(key)
+        while len(_render_memo) > _RENDER_MEMO_SIZE:
+            _render_memo.popitem(last=False)
+    return img
+
+
+def _render_json_mode(
+    mode_def: dict,
+    content: dict,
+    *,
+    date_str: str,
+    weather_str: str,
+    battery_pct: float,
+    weather_code: int,
+    time_str: str,
+    screen_w: int,
+    screen_h: int,
+    colors: int,
+    language: str,
+) -> tuple[Image.Image, bool]:
+    """Render the frame; also report whether any block degraded (see RenderContext)."""
+    img = _new_canvas(screen_w, screen_h, colors)
     draw = ImageDraw.Draw(img)
     apply_text_fontmode(draw)
     layout = mode_def.get("layout", {})
@@ -301,7 +455,27 @@ def render_json_mode(
             y=status_bar_bottom, footer_height=footer_height, colors=colors,
         )
         _render_centered_text(ctx, body[0], use_full_body=True)
+        degraded = ctx.degraded
+    elif body_align == "center" and body and not _has_absolute_y(body):
+        # Render the body once on a blank canvas, then blit its ink down by
+        # the centering offset instead of replaying every block twice.
+        body_img = _new_canvas(screen_w, screen_h, colors)
+        ctx = RenderContext(
+            draw=ImageDraw.Draw(body_img), img=body_img, content=content,
+            screen_w=screen_w, screen_h=screen_h,
+            y=status_bar_bottom, footer_height=footer_height, colors=colors,
+        )
+        apply_text_fontmode(ctx.draw)
+        for block in body:
+            _render_block(ctx, block)
+        degraded = ctx.degraded
+        content_height = ctx.y - status_bar_bottom
+        available_height = footer_top - status_bar_bottom
+        offset = max(0, (available_height - content_height) // 2)
+        img.paste(body_img, (0, offset), _ink_mask(body_img))
     elif body_align == "center" and body:
+        # Absolutely placed blocks must not move with the centering offset,
+        # so measure first and then draw in place.
         measure_img = Image.new("1", (screen_w, screen_h), EINK_BG)
         measure_ctx = RenderContext(
             draw=ImageDraw.Draw(measure_img), img=measure_img, content=content,
@@ -310,8 +484,6 @@ def render_json_mode(
         )
         apply_text_fontmode(measure_ctx.draw)
         for block in body:
-            if measure_ctx.y >= footer_top - 10:
-                break
             _render_block(measure_ctx, block)
         content_height = measure_ctx.y - status_bar_bottom
         available_height = footer_top - status_bar_bottom
@@ -323,9 +495,8 @@ def render_json_mode(
             y=status_bar_bottom + offset, footer_height=footer_height, colors=colors,
         )
         for block in body:
-            if ctx.y >= footer_top - 10:
-                break
             _render_block(ctx, block)
+        degraded = measure_ctx.degraded or ctx.degraded
     else:
         ctx = RenderContext(
             draw=draw, img=img, content=content,
@@ -333,9 +504,8 @@ def render_json_mode(
             y=status_bar_bottom, footer_height=footer_height, colors=colors,
         )
         for block in body:
-            if ctx.y >= footer_top - 10:
-                break
             _render_block(ctx, block)
+        degraded = ctx.degraded
 
     # 3. Footer
     ft = ft_layout
@@ -357,7 +527,7 @@ def render_json_mode(
         colors=colors,
     )
 
-    return img
+    return img, degraded
 
 
 # ── Block dispatcher ─────────────────────────────────────────
@@ -366,13 +536,33 @@ def render_json_mode(
 _BLOCK_RENDERERS: dict[str, Any] = {}
 
 
-def _render_block(ctx: RenderContext, block: dict) -> None:
-    btype = block.get("type", "")
-    renderer = _BLOCK_RENDERERS.get(btype)
-    if renderer:
-        renderer(ctx, block)
-    else:
-        logger.warning(f"[JSONRenderer] Unknown block type: {btype}")
+# Block types that draw nothing when their bound field is empty.
+_FIELD_ONLY_BLOCKS = frozenset({
+    "centered_text", "text", "icon_text", "image", "big_number", "temp_chart", "forecast_cards",
+})
+
+
+def _block_is_empty(ctx: RenderContext, block: dict) -> bool:
+    """True if the block's explicit field is empty, so dispatching it would draw nothing."""
+    field_name = block.get("field")
+    if not field_name or block.get("type") not in _FIELD_ONLY_BLOCKS:
+        return False
+    value = ctx.content.get(field_name)
+    return not value and value != 0
+
+
+def _render_block(ctx: RenderContext, block: dict) -> bool:
+    """Dispatch one block; False only when it starts too close to the footer."""
+    if ctx.y >= ctx.footer_top - 10:
+        return False
+    if _block_is_empty(ctx, block):
+        return True
+    renderer = _BLOCK_RENDERERS.get(block.get("type", ""))
+    if renderer is None:
+        logger.warning("[JSONRenderer] Unknown block type: %s", block.get("type", ""))
+        return True
+    renderer(ctx, block)
+    return True
 
 
 # ── Block implementations ────────────────────────────────────
@@ -392,39 +582,46 @@ def _render_centered_text(ctx: RenderContext, block: dict, *, use_full_body: boo
 
     body_height = ctx.footer_top - ctx.y
     max_w = int(ctx.available_width * max_ratio)
-    lines = []
-    font = None
-    line_h = font_size + line_spacing
-    total_h = 0
-    while font_size >= 10:
-        if font_name:
-            if has_cjk(text) and "Noto" not in font_name:
-                font_name = "NotoSerifSC-Light.ttf"
-            font = load_font_by_name(font_name, font_size)
-        else:
-            if has_cjk(text):
-                font_key = "noto_serif_light"
-            font = load_font(font_key, font_size)
-
-        lines = wrap_text(text, font, max_w)
-        line_h = font_size + line_spacing
-        total_h = len(lines) * line_h
-
-        if use_full_body and block.get("vertical_center", True) and total_h > body_height:
+    if font_name:
+        if has_cjk(text) and "Noto" not in font_name:
+            font_name = "NotoSerifSC-Light.ttf"
+    elif has_cjk(text):
+        font_key = "noto_serif_light"
+    # "balanced" evens out line lengths (minimum raggedness); it changes the
+    # layout, so blocks opt in and greedy wrapping stays the default.
+    wrap = wrap_text_balanced if block.get("wrap") == "balanced" else wrap_text
+
+    def _layout(size: int):
+        # Shrink probes go through the memoized loaders, so each (font, size)
+        # maps to one object and the font-keyed wrap/bbox caches keep hitting.
+        f = load_font_by_name(font_name, size) if font_name else load_font(font_key, size)
+        wrapped = wrap(text, f, max_w)
+        return f, wrapped, len(wrapped) * (size + line_spacing)
+
+    font, lines, total_h = _layout(font_size)
+    shrink = use_full_body and block.get("vertical_center", True)
+    if shrink and total_h > body_height and font_size >= 12:
+        # Text area scales roughly with font_size², so one estimate usually
+        # lands on a size that fits; step down only if it still overflows.
+        ratio = (max(body_height, 1) / total_h) ** 0.5
+        font_size = max(10, min(font_size - 2, int(font_size * ratio)))
+        font, lines, total_h = _layout(font_size)
+        while total_h > body_height and font_size >= 12:
             font_size -= 2
-        else:
-            break
+            font, lines, total_h = _layout(font_size)
+    line_h = font_size + line_spacing
 
-    if use_full_body and block.get("vertical_center", True):
+    if shrink:
         y_start = ctx.y + (body_height - total_h) // 2
     else:
         y_start = ctx.y
 
+    color = ctx.resolve_color(block)
     for i, line in enumerate(lines):
-        bbox = font.getbbox(line)
+        bbox = text_bbox(font, line)
         lw = bbox[2] - bbox[0]
         x = ctx.x_offset + (ctx.available_width - lw) // 2
-        ctx.draw.text((x, y_start + i * line_h), line, fill=ctx.resolve_color(block), font=font)
+        ctx.draw.text((x, y_start + i * line_h), line, fill=color, font=font)
 
     ctx.y = y_start + total_h + 4
 
@@ -450,10 +647,7 @@ def _render_text(ctx: RenderContext, block: dict) -> None:
 
     align = block.get("align", "center")
     margin_x = block.get("margin_x")
-    if margin_x is not None:
-        margin_x = int(margin_x * ctx.scale)
-    else:
-        margin_x = int(ctx.screen_w * 0.06)
+    margin_x = ctx.block_margin_x(margin_x, ctx.margin_x)
     max_lines = block.get("max_lines", 3)
     max_w = max(20, ctx.available_width - margin_x * 2)
 
@@ -464,28 +658,33 @@ def _render_text(ctx: RenderContext, block: dict) -> None:
         if lines:
             lines[-1] = lines[-1].rstrip() + "..."
 
+    color = ctx.resolve_color(block)
+    draw = ctx.draw
+    x_off = ctx.x_offset
+    av_w = ctx.available_width
+    stop_y = ctx.footer_top - 10
+    line_step = font_size + 6
+    y = ctx.y
     for line in lines:
-        if ctx.y >= ctx.footer_top - 10:
+        if y >= stop_y:
             break
-        bbox = font.getbbox(line)
-        lw = bbox[2] - bbox[0]
         if align == "center":
-            x = ctx.x_offset + (ctx.available_width - lw) // 2
+            bbox = text_bbox(font, line)
+            x = x_off + (av_w - (bbox[2] - bbox[0])) // 2
         elif align == "right":
-            x = ctx.x_offset + ctx.available_width - margin_x - lw
+            bbox = text_bbox(font, line)
+            x = x_off + av_w - margin_x - (bbox[2] - bbox[0])
         else:
-            x = ctx.x_offset + margin_x
-        ctx.draw.text((x, ctx.y), line, fill=ctx.resolve_color(block), font=font)
-        ctx.y += font_size + 6
+            x = x_off + margin_x
+        draw.text((x, y), line, fill=color, font=font)
+        y += line_step
+    ctx.y = y
 
 
 def _render_separator(ctx: RenderContext, block: dict) -> None:
     style = block.get("style", "solid")
     margin_x = block.get("margin_x")
-    if margin_x is not None:
-        margin_x = int(margin_x * ctx.scale)
-    else:
-        margin_x = int(ctx.screen_w * 0.06)
+    margin_x = ctx.block_margin_x(margin_x, ctx.margin_x)
     line_width = block.get("line_width", 1)
 
     color = ctx.resolve_color(block)
@@ -515,7 +714,7 @@ def _render_section(ctx: RenderContext, block: dict) -> None:
         title_font_key = _pick_cjk_font(title_font_key)
     font = load_font(title_font_key, title_font_size)
 
-    margin_x = int(ctx.screen_w * 0.06)
+    margin_x = ctx.margin_x
     x = ctx.x_offset + margin_x
     icon_size = int(12 * ctx.scale)
     if icon_name:
@@ -528,11 +727,25 @@ def _render_section(ctx: RenderContext, block: dict) -> None:
     ctx.y += title_font_size + int(6 * ctx.scale)
 
     for child in block.get("children") or block.get("blocks", []):
-        if ctx.y >= ctx.footer_top - 10:
-            break
         _render_block(ctx, child)
 
 
+def _list_item_expander(item: Any, index: int):
+    """Build a re.sub callback filling one list item's template placeholders."""
+    fields = item if isinstance(item, dict) else {}
+
+    def _expand(m: re.Match) -> str:
+        key = m.group(1)
+        if key in fields:
+            return str(fields[key])
+        if key == "_value":
+            return str(item)
+        if key == "index":
+            return str(index)
+        return m.group(0)
+    return _expand
+
+
 def _render_list(ctx: RenderContext, block: dict) -> None:
     field_name = block.get("field", "")
     items = ctx.get_field(field_name)
@@ -547,10 +760,7 @@ def _render_list(ctx: RenderContext, block: dict) -> None:
     font_size = int(block.get("font_size", 13) * ctx.scale)
     spacing = int(block.get("item_spacing", 16) * ctx.scale)
     margin_x = block.get("margin_x")
-    if margin_x is not None:
-        margin_x = int(margin_x * ctx.scale)
-    else:
-        margin_x = int(ctx.screen_w * 0.08)
+    margin_x = ctx.block_margin_x(margin_x, ctx.wide_margin_x)
 
     align = block.get("align", "left")
 
@@ -559,61 +769,63 @@ def _render_list(ctx: RenderContext, block: dict) -> None:
     font = load_font(font_key_cjk, font_size)
     item_height = spacing
 
+    draw = ctx.draw
+    x_off = ctx.x_offset
+    av_w = ctx.available_width
+    foot_top = ctx.footer_top
+    color = ctx.resolve_color(block)
+    right_col_w = int(80 * ctx.scale)
+    max_text_w = av_w - margin_x * 2 if not right_field else av_w - margin_x - right_col_w
+    y = ctx.y
+
     rendered_count = 0
+    truncated = False
     for i, item in enumerate(items[:max_items]):
-        if ctx.y + item_height > ctx.footer_top:
-            remaining = len(items) - rendered_count
-            if remaining > 0:
-                more_text = f"+{remaining} more"
-                more_font = load_font(_pick_cjk_font(font_key), int(11 * ctx.scale))
-                ctx.draw.text((ctx.x_offset + margin_x, ctx.y), more_text, fill=ctx.resolve_color(block), font=more_font)
-            break
-        if ctx.y >= ctx.footer_top - 10:
+        if y + item_height > foot_top or y >= foot_top - 10:
+            truncated = True
             break
 
-        if isinstance(item, dict):
-            text = template
-            for k, v in item.items():
-                text = text.replace("{" + k + "}", str(v))
-            text = text.replace("{_value}", str(item))
+        if isinstance(item, dict) or (template and "{_value}" in template):
+            text = _PLACEHOLDER_RE.sub(_list_item_expander(item, i + 1), template)
         else:
-            text = str(item)
-            if template and "{_value}" in template:
-                text = template.replace("{_value}", str(item))
+            text = str(item).replace("{index}", str(i + 1))
 
         if numbered:
             text = f"{i + 1}. {text}"
-        text = text.replace("{index}", str(i + 1))
 
-        right_col_w = int(80 * ctx.scale)
-        max_text_w = ctx.available_width - margin_x * 2 if not right_field else ctx.available_width - margin_x - right_col_w
         lines = wrap_text(text, font, max_text_w)
 
-        color = ctx.resolve_color(block)
         if align == "center":
             for ln in lines[:1]:
-                bbox = font.getbbox(ln)
+                bbox = text_bbox(font, ln)
                 lw = bbox[2] - bbox[0]
-                ctx.draw.text((ctx.x_offset + (ctx.available_width - lw) // 2, ctx.y), ln, fill=color, font=font)
+                draw.text((x_off + (av_w - lw) // 2, y), ln, fill=color, font=font)
         else:
             for ln in lines[:1]:
-                ctx.draw.text((ctx.x_offset + margin_x, ctx.y), ln, fill=color, font=font)
+                draw.text((x_off + margin_x, y), ln, fill=color, font=font)
 
         if right_field and isinstance(item, dict):
             rv = str(item.get(right_field, ""))
             if rv:
-                ctx.draw.text((ctx.x_offset + ctx.available_width - right_col_w, ctx.y), rv, fill=color, font=font)
+                draw.text((x_off + av_w - right_col_w, y), rv, fill=color, font=font)
 
-        ctx.y += spacing
+        y += spacing
         rendered_count += 1
 
+    # The "+N more" font is only needed once the list overflows the body.
+    remaining = len(items) - rendered_count
+    if truncated and remaining > 0:
+        more_font = load_font(font_key_cjk, int(11 * ctx.scale))
+        draw.text((x_off + margin_x, y), f"+{remaining} more", fill=color, font=more_font)
+
+    ctx.y = y
+
 
 def _render_vertical_stack(ctx: RenderContext, block: dict) -> None:
     spacing = block.get("spacing", 0)
     for child in block.get("children", []):
-        if ctx.y >= ctx.footer_top - 10:
+        if not _render_block(ctx, child):
             break
-        _render_block(ctx, child)
         ctx.y += spacing
 
 
@@ -669,10 +881,7 @@ def _render_icon_text(ctx: RenderContext, block: dict) -> None:
     font_size = int(block.get("font_size", 14) * ctx.scale)
     icon_size = int(block.get("icon_size", 12) * ctx.scale)
     margin_x = block.get("margin_x")
-    if margin_x is not None:
-        margin_x = int(margin_x * ctx.scale)
-    else:
-        margin_x = int(ctx.screen_w * 0.06)
+    margin_x = ctx.block_margin_x(margin_x, ctx.margin_x)
 
     if has_cjk(text):
         font_key = _pick_cjk_font(font_key)
@@ -691,8 +900,6 @@ def _render_icon_text(ctx: RenderContext, block: dict) -> None:
 
 def _render_weather_icon_text(ctx: RenderContext, block: dict) -> None:
     """Render dynamic weather icon (by code) with a text label on the same line."""
-    from .patterns.utils import get_weather_icon
-
     code_field = block.get("code_field", "today_code")
     text_field = block.get("field")
     template = block.get("text", "")
@@ -719,10 +926,7 @@ def _render_weather_icon_text(ctx: RenderContext, block: dict) -> None:
     font_size = int(block.get("font_size", 14) * ctx.scale)
     icon_size = int(block.get("icon_size", 18) * ctx.scale)
     margin_x = block.get("margin_x")
-    if margin_x is not None:
-        margin_x = int(margin_x * ctx.scale)
-    else:
-        margin_x = int(ctx.screen_w * 0.06)
+    margin_x = ctx.block_margin_x(margin_x, ctx.margin_x)
 
     if has_cjk(text):
         font_key = _pick_cjk_font(font_key)
@@ -732,10 +936,8 @@ def _render_weather_icon_text(ctx: RenderContext, block: dict) -> None:
     y = ctx.y
 
     if code_int >= 0:
-        icon_img = get_weather_icon(code_int)
+        icon_img = _scaled_weather_icon(code_int, icon_size)
         if icon_img:
-            if icon_img.size[0] != icon_size:
-                icon_img = icon_img.resize((icon_size, icon_size), Image.LANCZOS)
             ctx.paste_icon(icon_img, (x, y))
             x += icon_size + int(4 * ctx.scale)
 
@@ -759,7 +961,7 @@ def _render_big_number(ctx: RenderContext, block: dict) -> None:
     if has_cjk(text):
         font_key = _pick_cjk_font(font_key)
     font = load_font(font_key, font_size)
-    bbox = font.getbbox(text)
+    bbox = text_bbox(font, text)
     tw = bbox[2] - bbox[0]
     align = block.get("align", "center")
     _raw_margin = block.get("margin_x")
@@ -783,11 +985,7 @@ def _render_progress_bar(ctx: RenderContext, block: dict) -> None:
     ratio = max(0.0, min(1.0, value / max_value))
     width = int(block.get("width", 80) * ctx.scale)
     height = int(block.get("height", 6) * ctx.scale)
-    _raw_margin = block.get("margin_x")
-    if _raw_margin is not None:
-        margin_x = int(_raw_margin * ctx.scale)
-    else:
-        margin_x = int(ctx.screen_w * 0.06)
+    margin_x = ctx.block_margin_x(block.get("margin_x"), ctx.margin_x)
     x = ctx.x_offset + margin_x
     y = ctx.y
     ctx.draw.rectangle([x, y, x + width, y + height], outline=EINK_FG, width=1)
@@ -838,10 +1036,7 @@ def _render_temp_chart(ctx: RenderContext, block: dict) -> None:
         max_t = min_t + 1  # avoid divide-by-zero, draw a flat line
 
     margin_x = block.get("margin_x")
-    if margin_x is not None:
-        margin_x = int(margin_x * ctx.scale)
-    else:
-        margin_x = int(ctx.screen_w * 0.08)
+    margin_x = ctx.block_margin_x(margin_x, ctx.wide_margin_x)
 
     chart_height = int(block.get("height", 40) * ctx.scale)
     # 在右侧预留一点空白，避免折线紧贴屏幕边缘被“截断”的视觉效果
@@ -863,41 +1058,36 @@ def _render_temp_chart(ctx: RenderContext, block: dict) -> None:
     else:
         step = width / (n - 1)
 
-    high_coords: list[tuple[float, float]] = []
-    low_coords: list[tuple[float, float]] = []
-    for idx, (h_temp, l_temp) in enumerate(zip(highs, lows)):
-        x = x0 + step * idx
-        ratio_h = (h_temp - min_t) / (max_t - min_t)
-        ratio_l = (l_temp - min_t) / (max_t - min_t)
-        y_h = y_bottom - ratio_h * (chart_height - 8)
-        y_l = y_bottom - ratio_l * (chart_height - 8)
-        high_coords.append((x, y_h))
-        low_coords.append((x, y_l))
-
-    # Draw connecting lines
-    for i in range(1, len(high_coords)):
-        ctx.draw.line([high_coords[i - 1], high_coords[i]], fill=EINK_FG, width=1)
-    for i in range(1, len(low_coords)):
-        ctx.draw.line([low_coords[i - 1], low_coords[i]], fill=EINK_FG, width=1)
+    y_per_deg = (chart_height - 8) / (max_t - min_t)
+    xs = [x0 + step * idx for idx in range(n)]
+    high_coords = [(x, y_bottom - (t - min_t) * y_per_deg) for x, t in zip(xs, highs)]
+    low_coords = [(x, y_bottom - (t - min_t) * y_per_deg) for x, t in zip(xs, lows)]
+
+    draw = ctx.draw
+
+    # Draw each polyline in a single call
+    if n > 1:
+        draw.line(high_coords, fill=EINK_FG, width=1)
+        draw.line(low_coords, fill=EINK_FG, width=1)
 
     # Draw points and labels（只标注最高温数字，最低温仅用空心点表示）
     font = load_font("noto_serif_light", int(10 * ctx.scale))
+    r = int(2 * ctx.scale) or 1
     for (xh, yh), (xl, yl), h_temp, l_temp, label in zip(
         high_coords, low_coords, highs, lows, labels
     ):
-        r = int(2 * ctx.scale) or 1
         # 最高温：实心圆点
-        ctx.draw.ellipse([xh - r, yh - r, xh + r, yh + r], fill=EINK_FG)
+        draw.ellipse([xh - r, yh - r, xh + r, yh + r], fill=EINK_FG)
         # 最低温：空心圆点
-        ctx.draw.ellipse([xl - r, yl - r, xl + r, yl + r], fill=EINK_BG)
-        ctx.draw.ellipse([xl - r, yl - r, xl + r, yl + r], outline=EINK_FG, width=1)
+        draw.ellipse([xl - r, yl - r, xl + r, yl + r], fill=EINK_BG)
+        draw.ellipse([xl - r, yl - r, xl + r, yl + r], outline=EINK_FG, width=1)
 
         # 最高温数字（在图顶上方）
         temp_text_high = str(int(round(h_temp)))
-        hbbox = font.getbbox(temp_text_high)
+        hbbox = text_bbox(font, temp_text_high)
         htw = hbbox[2] - hbbox[0]
         hth = hbbox[3] - hbbox[1]
-        ctx.draw.text(
+        draw.text(
             (xh - htw / 2, y_top - hth - 2),
             temp_text_high,
             fill=EINK_FG,
@@ -905,9 +1095,9 @@ def _render_temp_chart(ctx: RenderContext, block: dict) -> None:
         )
 
         if label:
-            lbbox = font.getbbox(label)
+            lbbox = text_bbox(font, label)
             lw = lbbox[2] - lbbox[0]
-            ctx.draw.text((xh - lw / 2, y_bottom + 2), label, fill=EINK_FG, font=font)
+            draw.text((xh - lw / 2, y_bottom + 2), label, fill=EINK_FG, font=font)
 
     ctx.y = y_bottom + int(18 * ctx.scale)
 
@@ -951,8 +1141,6 @@ def _render_forecast_cards(ctx: RenderContext, block: dict) -> None:
         font_desc = load_font("lora_regular", int(12 * scale))
         font_temp = load_font("inter_medium", int(12 * scale))
 
-    from .patterns.utils import get_weather_icon
-
     top_y = ctx.y
     card_bottom_max = top_y
 
@@ -981,14 +1169,14 @@ def _render_forecast_cards(ctx: RenderContext, block: dict) -> None:
 
         # Day (e.g. 今天)
         if day:
-            bbox = font_day.getbbox(day)
+            bbox = text_bbox(font_day, day)
             dw = bbox[2] - bbox[0]
             ctx.draw.text((x_center - dw / 2, y), day, fill=EINK_FG, font=font_day)
             y += (bbox[3] - bbox[1]) + int(3 * scale)
 
         # Date (e.g. 04/22)
         if date:
-            bbox = font_date.getbbox(date)
+            bbox = text_bbox(font_date, date)
             tw = bbox[2] - bbox[0]
             th = bbox[3] - bbox[1]
             ctx.draw.text((x_center - tw / 2, y), date, fill=EINK_FG, font=font_date)
@@ -1003,16 +1191,14 @@ def _render_forecast_cards(ctx: RenderContext, block: dict) -> None:
                 code_int = int(code)
         except (TypeError, ValueError):
             code_int = -1
-        wx_icon = get_weather_icon(code_int) if code_int >= 0 else None
+        wx_icon = _scaled_weather_icon(code_int, icon_size) if code_int >= 0 else None
         if wx_icon:
-            if wx_icon.size[0] != icon_size:
-                wx_icon = wx_icon.resize((icon_size, icon_size), Image.LANCZOS)
             ctx.paste_icon(wx_icon, (int(x_center - icon_size / 2), int(y)))
             y += icon_size + int(4 * scale)
 
         # Desc (e.g. 多云)
         if desc:
-            bbox = font_desc.getbbox(desc)
+            bbox = text_bbox(font_desc, desc)
             tw = bbox[2] - bbox[0]
             th = bbox[3] - bbox[1]
             ctx.draw.text((x_center - tw / 2, y), desc, fill=EINK_FG, font=font_desc)
@@ -1020,7 +1206,7 @@ def _render_forecast_cards(ctx: RenderContext, block: dict) -> None:
 
         # Temp range (e.g. 9/13°)
         if temp_label:
-            bbox = font_temp.getbbox(temp_label)
+            bbox = text_bbox(font_temp, temp_label)
             tw = bbox[2] - bbox[0]
             th = bbox[3] - bbox[1]
             ctx.draw.text((x_center - tw / 2, y), temp_label, fill=EINK_FG, font=font_temp)
@@ -1035,12 +1221,8 @@ def _render_two_column(ctx: RenderContext, block: dict) -> None:
     # Auto-downgrade to single column on very short screens
     if ctx.screen_h < 200:
         for child in block.get("left", []):
-            if ctx.y >= ctx.footer_top - 10:
-                break
             _render_block(ctx, child)
         for child in block.get("right", []):
-            if ctx.y >= ctx.footer_top - 10:
-                break
             _render_block(ctx, child)
         return
 
@@ -1065,6 +1247,7 @@ def _render_two_column(ctx: RenderContext, block: dict) -> None:
     for child in block.get("right", []):
         _render_block(right_ctx, child)
     ctx.y = max(left_ctx.y, right_ctx.y)
+    ctx.degraded = ctx.degraded or left_ctx.degraded or right_ctx.degraded
 
 
 def _render_key_value(ctx: RenderContext, block: dict) -> None:
@@ -1082,11 +1265,7 @@ def _render_key_value(ctx: RenderContext, block: dict) -> None:
     text = f"{label}: {value_text}" if label else value_text
     font_size = int(block.get("font_size", 12) * ctx.scale)
     font = load_font("noto_serif_light", font_size)
-    _raw_margin = block.get("margin_x")
-    if _raw_margin is not None:
-        margin_x = int(_raw_margin * ctx.scale)
-    else:
-        margin_x = int(ctx.screen_w * 0.06)
+    margin_x = ctx.block_margin_x(block.get("margin_x"), ctx.margin_x)
     ctx.draw.text((ctx.x_offset + margin_x, ctx.y), text, fill=EINK_FG, font=font)
     ctx.y += font_size + 4
 
@@ -1109,8 +1288,6 @@ def _render_group(ctx: RenderContext, block: dict) -> None:
 
 def _render_weather_icon(ctx: RenderContext, block: dict) -> None:
     """Render weather icon based on weather_code field."""
-    from .patterns.utils import get_weather_icon
-    
     field_name = block.get("field", "code")
     weather_code = ctx.get_field(field_name)
     
@@ -1129,17 +1306,10 @@ def _render_weather_icon(ctx: RenderContext, block: dict) -> None:
     icon_size = int(block.get("icon_size", 48) * ctx.scale)
     align = block.get("align", "left")
     margin_x = block.get("margin_x")
-    if margin_x is not None:
-        margin_x = int(margin_x * ctx.scale)
-    else:
-        margin_x = int(ctx.screen_w * 0.06)
+    margin_x = ctx.block_margin_x(margin_x, ctx.margin_x)
     
-    weather_icon = get_weather_icon(weather_code)
+    weather_icon = _scaled_weather_icon(weather_code, icon_size)
     if weather_icon:
-        # 调整图标大小
-        if weather_icon.size[0] != icon_size:
-            weather_icon = weather_icon.resize((icon_size, icon_size), Image.LANCZOS)
-        
         x = ctx.x_offset + margin_x
         if align == "center":
             x = ctx.x_offset + (ctx.available_width - icon_size) // 2
@@ -1165,20 +1335,25 @@ def _render_icon_list(ctx: RenderContext, block: dict) -> None:
     else:
         margin_x = int(ctx.available_width * 0.06)
     line_h = int(block.get("line_height", 16) * ctx.scale)
+    draw = ctx.draw
+    x0 = ctx.x_offset + margin_x
+    icon_size = int(12 * ctx.scale)
+    icon_advance = int(16 * ctx.scale)
+    y = ctx.y
     for item in items[:max_items]:
         if not isinstance(item, dict):
             continue
         icon_name = item.get(icon_field)
         text = str(item.get(text_field, ""))
-        x = ctx.x_offset + margin_x
-        icon_size = int(12 * ctx.scale)
+        x = x0
         if icon_name:
             icon_img = load_icon(icon_name, size=(icon_size, icon_size))
             if icon_img:
-                ctx.paste_icon(icon_img, (x, ctx.y))
-                x += int(16 * ctx.scale)
-        ctx.draw.text((x, ctx.y), text, fill=EINK_FG, font=font)
-        ctx.y += line_h
+                ctx.paste_icon(icon_img, (x, y))
+                x += icon_advance
+        draw.text((x, y), text, fill=EINK_FG, font=font)
+        y += line_h
+    ctx.y = y
 
 
 def _resolve_local_asset(url: str) -> str | None:
@@ -1217,11 +1392,11 @@ def _render_image(ctx: RenderContext, block: dict) -> None:
     height = int(block.get("height", 140) * ctx.scale)
     x = int(block.get("x", (ctx.screen_w - width) // 2))
     y = int(block.get("y", ctx.y))
+    dither = bool(block.get("dither", True))
     # Try pre-fetched data first (async download from json_content.py)
     prefetched = ctx.content.get(f"_prefetched_{field_name}")
     if prefetched:
-        from io import BytesIO
-        img = _convert_image_block(Image.open(BytesIO(prefetched)), width, height, ctx.colors)
+        img = _convert_image_block(Image.open(BytesIO(prefetched)), width, height, ctx.colors, dither)
         if ctx.colors >= 3:
             ctx.img.paste(img, (x, y))
         else:
@@ -1231,7 +1406,7 @@ def _render_image(ctx: RenderContext, block: dict) -> None:
     local_path = _resolve_local_asset(image_url)
     if local_path:
         try:
-            img = _convert_image_block(Image.open(local_path), width, height, ctx.colors)
+            img = _convert_image_block(Image.open(local_path), width, height, ctx.colors, dither)
             if ctx.colors >= 3:
                 ctx.img.paste(img, (x, y))
             else:
@@ -1240,21 +1415,13 @@ def _render_image(ctx: RenderContext, block: dict) -> None:
             return
         except (OSError, UnidentifiedImageError):
             logger.warning("[JSONRenderer] Failed to load local asset %s", local_path, exc_info=True)
+    ctx.degraded = True
     try:
         resp = None
         last_error = None
-        attempts = [
-            {"trust_env": True, "timeout": httpx.Timeout(connect=8.0, read=12.0, write=8.0, pool=8.0)},
-            {"trust_env": False, "timeout": httpx.Timeout(connect=12.0, read=18.0, write=10.0, pool=10.0)},
-        ]
-        for opts in attempts:
+        for opts in _IMAGE_FETCH_ATTEMPTS:
             try:
-                with httpx.Client(
-                    timeout=opts["timeout"],
-                    follow_redirects=True,
-                    trust_env=opts["trust_env"],
-                ) as client:
-                    resp = client.get(image_url)
+                resp = _image_client(opts["trust_env"], opts["timeout"]).get(image_url)
                 if resp.status_code >= 400:
                     raise ValueError(f"HTTP {resp.status_code}")
                 break
@@ -1263,8 +1430,7 @@ def _render_image(ctx: RenderContext, block: dict) -> None:
                 resp = None
         if resp is None:
             raise last_error if last_error else ValueError("image fetch failed")
-        from io import BytesIO
-        img = _convert_image_block(Image.open(BytesIO(resp.content)), width, height, ctx.colors)
+        img = _convert_image_block(Image.open(BytesIO(resp.content)), width, height, ctx.colors, dither)
         if ctx.colors >= 3:
             ctx.img.paste(img, (x, y))
         else:
@@ -1275,7 +1441,7 @@ def _render_image(ctx: RenderContext, block: dict) -> None:
         ctx.draw.rectangle([x, y, x + width, y + height], outline=EINK_FG, width=1)
         placeholder_font = load_font("noto_serif_light", int(12 * ctx.scale))
         placeholder_text = "Image unavailable"
-        bbox = placeholder_font.getbbox(placeholder_text)
+        bbox = text_bbox(placeholder_font, placeholder_text)
         tw = bbox[2] - bbox[0]
         th = bbox[3] - bbox[1]
         tx = x + (width - tw) // 2
@@ -1287,6 +1453,17 @@ def _render_image(ctx: RenderContext, block: dict) -> None:
 # ── Helpers ──────────────────────────────────────────────────
 
 
+@lru_cache(maxsize=128)
+def _scaled_weather_icon(weather_code: int, icon_size: int) -> Image.Image | None:
+    """Weather icon at the requested size, cached across renders (treat as read-only)."""
+    icon = get_weather_icon(weather_code)
+    if icon is not None and icon.size[0] != icon_size:
+        # Icons are 1-bit, where Pillow resamples nearest-neighbour anyway;
+        # BILINEAR keeps the kernel cheap if a grayscale icon ever appears.
+        icon = icon.resize((icon_size, icon_size), Image.BILINEAR)
+    return icon
+
+
 def _pick_cjk_font(font_key: str) -> str:
     """Ensure CJK text gets a Noto Serif font variant."""
     if font_key.startswith("noto_serif"):
@@ -1338,7 +1515,7 @@ def _render_calendar_grid(ctx: RenderContext, block: dict) -> None:
 
     for ci, hdr in enumerate(headers[:7]):
         cx = x0 + ci * cell_w + cell_w // 2
-        bbox = header_font.getbbox(hdr)
+        bbox = text_bbox(header_font, hdr)
         tw = bbox[2] - bbox[0]
         color = weekend_color if ci >= 5 else EINK_FG
         ctx.draw.text((cx - tw // 2, ctx.y), hdr, fill=color, font=header_font)
@@ -1355,7 +1532,7 @@ def _render_calendar_grid(ctx: RenderContext, block: dict) -> None:
             if not day_str:
                 continue
             cx = x0 + ci * cell_w + cell_w // 2
-            bbox = font.getbbox(day_str)
+            bbox = text_bbox(font, day_str)
             tw = bbox[2] - bbox[0]
             th = bbox[3] - bbox[1]
             tx = cx - tw // 2
@@ -1373,7 +1550,7 @@ def _render_calendar_grid(ctx: RenderContext, block: dict) -> None:
 
             sub = day_labels.get(day_str, "")
             if sub:
-                sb = sub_font.getbbox(sub)
+                sb = text_bbox(sub_font, sub)
                 sw = sb[2] - sb[0]
                 sx = cx - sw // 2
                 sy = ty + date_line_h
@@ -1475,9 +1652,9 @@ def _draw_two_line_cell(
         loc_disp, _ = _fit_text(loc, sf, max_w)
         total_h = line_h + sub_sz
         ny = cy + (row_h - total_h) // 2
-        nb = f.getbbox(line1); nw = nb[2] - nb[0]
+        nb = text_bbox(f, line1); nw = nb[2] - nb[0]
         ctx.draw.text((cx + (col_w - nw) // 2, ny), line1, fill=text_color, font=f)
-        lb = sf.getbbox(loc_disp); lw = lb[2] - lb[0]
+        lb = text_bbox(sf, loc_disp); lw = lb[2] - lb[0]
         ctx.draw.text((cx + (col_w - lw) // 2, ny + line_h), loc_disp, fill=loc_color, font=sf)
         return
 
@@ -1489,13 +1666,13 @@ def _draw_two_line_cell(
     total_h = line_h + sub_sz + sub_sz
     ny = cy + (row_h - total_h) // 2
 
-    nb = f.getbbox(line1); nw = nb[2] - nb[0]
+    nb = text_bbox(f, line1); nw = nb[2] - nb[0]
     ctx.draw.text((cx + (col_w - nw) // 2, ny), line1, fill=text_color, font=f)
 
-    l2b = sf.getbbox(line2); l2w = l2b[2] - l2b[0]
+    l2b = text_bbox(sf, line2); l2w = l2b[2] - l2b[0]
     ctx.draw.text((cx + (col_w - l2w) // 2, ny + line_h), line2, fill=text_color, font=sf)
 
-    lb = sf.getbbox(loc_disp); lw = lb[2] - lb[0]
+    lb = text_bbox(sf, loc_disp); lw = lb[2] - lb[0]
     ctx.draw.text((cx + (col_w - lw) // 2, ny + line_h + sub_sz), loc_disp, fill=loc_color, font=sf)
 
 
@@ -1505,7 +1682,7 @@ def _draw_single_line_cell(
 ) -> None:
     f = load_font(font_key, base_size)
     disp, _ = _fit_text(text, f, col_w - 4)
-    tb = f.getbbox(disp)
+    tb = text_bbox(f, disp)
     tw = tb[2] - tb[0]
     ctx.draw.text((cx + (col_w - tw) // 2, cy + (row_h - base_size) // 2), disp, fill=text_color, font=f)
 
@@ -1552,7 +1729,7 @@ def _render_timetable_weekly(ctx: RenderContext, block: dict) -> None:
     hx = x0 + time_col_w
     for di, wd_label in enumerate(weekdays[:5]):
         cx = hx + di * day_col_w + day_col_w // 2
-        bb = header_font.getbbox(wd_label)
+        bb = text_bbox(header_font, wd_label)
         tw = bb[2] - bb[0]
         tx = cx - tw // 2
         color = highlight_color if di == current_day else EINK_FG
@@ -1587,7 +1764,7 @@ def _render_timetable_weekly(ctx: RenderContext, block: dict) -> None:
             sep_y = ctx.y - 1
             ctx.draw.line([(x0, sep_y), (x0 + grid_w, sep_y)], fill=EINK_FG, width=1)
 
-        bb = period_font.getbbox(p_label)
+        bb = text_bbox(period_font, p_label)
         pw = bb[2] - bb[0]
         px = x0 + (time_col_w - pw) // 2
         py = ctx.y + (row_h - font_size) // 2
@@ -1636,25 +1813,27 @@ def _render_timetable_weekly(ctx: RenderContext, block: dict) -> None:
 
 # ── Register block types ─────────────────────────────────────
 
-_BLOCK_RENDERERS["centered_text"] = _render_centered_text
-_BLOCK_RENDERERS["text"] = _render_text
-_BLOCK_RENDERERS["separator"] = _render_separator
-_BLOCK_RENDERERS["section"] = _render_section
-_BLOCK_RENDERERS["list"] = _render_list
-_BLOCK_RENDERERS["vertical_stack"] = _render_vertical_stack
-_BLOCK_RENDERERS["conditional"] = _render_conditional
-_BLOCK_RENDERERS["spacer"] = _render_spacer
-_BLOCK_RENDERERS["icon_text"] = _render_icon_text
-_BLOCK_RENDERERS["weather_icon_text"] = _render_weather_icon_text
-_BLOCK_RENDERERS["two_column"] = _render_two_column
-_BLOCK_RENDERERS["image"] = _render_image
-_BLOCK_RENDERERS["progress_bar"] = _render_progress_bar
-_BLOCK_RENDERERS["temp_chart"] = _render_temp_chart
-_BLOCK_RENDERERS["forecast_cards"] = _render_forecast_cards
-_BLOCK_RENDERERS["big_number"] = _render_big_number
-_BLOCK_RENDERERS["icon_list"] = _render_icon_list
-_BLOCK_RENDERERS["key_value"] = _render_key_value
-_BLOCK_RENDERERS["group"] = _render_group
-_BLOCK_RENDERERS["weather_icon"] = _render_weather_icon
-_BLOCK_RENDERERS["calendar_grid"] = _render_calendar_grid
-_BLOCK_RENDERERS["timetable_grid"] = _render_timetable_grid
+_BLOCK_RENDERERS.update({
+    "centered_text": _render_centered_text,
+    "text": _render_text,
+    "separator": _render_separator,
+    "section": _render_section,
+    "list": _render_list,
+    "vertical_stack": _render_vertical_stack,
+    "conditional": _render_conditional,
+    "spacer": _render_spacer,
+    "icon_text": _render_icon_text,
+    "weather_icon_text": _render_weather_icon_text,
+    "two_column": _render_two_column,
+    "image": _render_image,
+    "progress_bar": _render_progress_bar,
+    "temp_chart": _render_temp_chart,
+    "forecast_cards": _render_forecast_cards,
+    "big_number": _render_big_number,
+    "icon_list": _render_icon_list,
+    "key_value": _render_key_value,
+    "group": _render_group,
+    "weather_icon": _render_weather_icon,
+    "calendar_grid": _render_calendar_grid,
+    "timetable_grid": _render_timetable_grid,
+})
@@ -4,19 +4,33 @@ AI 模式生成器
 """
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
 import logging
 import re
+import time
 
-from .content import _get_client, _clean_json_response
-from .mode_registry import _validate_mode_def
+from openai import BadRequestError
+
+from .content import _get_client, _clean_json_response, _llm_slot
+from .mode_registry import _json_loads, _validate_mode_def
 
 logger = logging.getLogger(__name__)
 
+# Validated definitions keyed by normalized description + provider/model,
+# so repeated requests skip the LLM round trip.
+_generation_cache: dict[str, tuple[dict, float]] = {}
+_GENERATION_CACHE_TTL = 3600
+_GENERATION_CACHE_MAX = 128
+
 # Vision-capable models per provider
 VISION_MODELS = {
     "aliyun": {"qwen-vl-max", "qwen-vl-plus"},
 }
+_VISION_PAIRS = frozenset(
+    (provider, model) for provider, models in VISION_MODELS.items() for model in models
+)
 
 AVAILABLE_ICONS = (
     "art, body, book, breakfast, cloud, cookie, dinner, electric_bolt, "
@@ -33,6 +47,8 @@ IMAGE_INTENT_PATTERNS = (
     r"image", r"illustration", r"poster", r"wallpaper", r"artwork", r"render",
     r"photo", r"painting", r"drawing", r"sketch",
 )
+_IMAGE_INTENT_RE = re.compile("|".join(IMAGE_INTENT_PATTERNS), re.IGNORECASE)
+_MODE_ID_INVALID_RE = re.compile(r"[^A-Z0-9_]")
 
 # Compact examples embedded directly
 _ZEN_EXAMPLE = """{
@@ -80,9 +96,11 @@ _STOIC_EXAMPLE = """{
 }"""
 
 
-def _build_generation_prompt(description: str) -> str:
-    """Build the meta-prompt that teaches the LLM to produce valid mode JSON."""
-    return f"""你是 InkSight 模式设计助手。InkSight 是一个墨水屏桌面伴侣，屏幕 400x300 像素，1位黑白显示。
+# Static meta-prompt that teaches the LLM to produce valid mode JSON. Built
+# once and sent as an identical leading system message on every call so
+# providers with automatic prefix caching can reuse it; only the short user
+# turn from _build_generation_prompt varies.
+_META_PROMPT = f"""你是 InkSight 模式设计助手。InkSight 是一个墨水屏桌面伴侣，屏幕 400x300 像素，1位黑白显示。
 
 你的任务是根据用户描述，生成一个完整有效的 InkSight 模式 JSON 定义。
 
@@ -135,9 +153,12 @@ noto_serif_light, noto_serif_regular, noto_serif_bold, lora_regular, lora_bold
 3. font_size 推荐: 标题 14-18, 正文 12-14, 注释 9-11, 大字展示 36-96
 4. fallback 数据必须完整，包含所有 output_schema 的字段
 5. prompt_template 中演示 JSON 格式时必须用双花括号 {{{{}}}} 转义，但 {{context}} 保持单花括号
-6. body 数组不要过长，一般 2-6 个块即可
+6. body 数组不要过长，一般 2-6 个块即可"""
 
-## 用户需求
+
+def _build_generation_prompt(description: str) -> str:
+    """Build the per-request user turn that follows the cached _META_PROMPT."""
+    return f"""## 用户需求
 {description}
 
 请直接输出完整有效的 JSON 模式定义，不要输出任何其他内容。"""
@@ -145,18 +166,18 @@ noto_serif_light, noto_serif_regular, noto_serif_bold, lora_regular, lora_bold
 
 def _supports_vision(provider: str, model: str) -> bool:
     """Check if the given provider/model supports image input."""
-    models = VISION_MODELS.get(provider, set())
-    return model in models
+    return (provider, model) in _VISION_PAIRS
 
 
 def _build_messages(prompt: str, image_base64: str | None = None,
                     provider: str = "", model: str = "") -> list[dict]:
-    """Build OpenAI-compatible messages, optionally with image."""
+    """Build OpenAI-compatible messages (static system prefix first), optionally with image."""
+    system = {"role": "system", "content": _META_PROMPT}
     if image_base64 and _supports_vision(provider, model):
         # Strip data URL prefix if present
         if "," in image_base64 and image_base64.startswith("data:"):
             image_base64 = image_base64.split(",", 1)[1]
-        return [{
+        return [system, {
             "role": "user",
             "content": [
                 {"type": "text", "text": prompt},
@@ -165,7 +186,39 @@ def _build_messages(prompt: str, image_base64: str | None = None,
                 }},
             ],
         }]
-    return [{"role": "user", "content": prompt}]
+    return [system, {"role": "user", "content": prompt}]
+
+
+class _JsonObjectScanner:
+    """Incrementally detect when the first top-level JSON object is closed."""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> bool:
+        """Consume a chunk; True once the object's closing brace has arrived."""
+        for ch in text:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                if self.started:
+                    self.in_string = True
+            elif ch == "{":
+                self.started = True
+                self.depth += 1
+            elif ch == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
 
 
 async def _call_llm_with_messages(
@@ -177,7 +230,11 @@ async def _call_llm_with_messages(
     api_key: str | None = None,
     base_url: str | None = None,
 ) -> str:
-    """Call LLM with pre-built messages (supports multimodal)."""
+    """Call LLM with pre-built messages (supports multimodal).
+
+    The response is streamed and cut off as soon as the mode JSON object is
+    complete, so trailing commentary is never waited for.
+    """
     client, _ = _get_client(provider, model, api_key=api_key, base_url=base_url)
     request_kwargs = {
         "model": model,
@@ -187,6 +244,45 @@ async def _call_llm_with_messages(
     }
     if provider == "aliyun" and model == "qwen3.5-flash":
         request_kwargs["extra_body"] = {"enable_thinking": False}
+    async with _llm_slot(client):
+        try:
+            stream = await client.chat.completions.create(**request_kwargs, stream=True)
+        except BadRequestError:
+            logger.info("[MODE_GEN] %s/%s rejected streaming, retrying without", provider, model)
+            return await _complete_llm_request(client, provider, model, request_kwargs)
+
+        parts: list[str] = []
+        scanner = _JsonObjectScanner()
+        finish_reason = None
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                delta = choice.delta.content if choice.delta else None
+                if delta:
+                    parts.append(delta)
+                    if scanner.feed(delta):
+                        finish_reason = "json_complete"
+                        break
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+        finally:
+            await stream.response.aclose()
+    text = "".join(parts).strip()
+
+    logger.info(
+        f"[MODE_GEN] {provider}/{model} chars={len(text)}, "
+        f"finish={finish_reason}"
+    )
+    if finish_reason == "length":
+        logger.warning("[MODE_GEN] Response truncated due to max_tokens limit")
+
+    return text
+
+
+async def _complete_llm_request(client, provider: str, model: str, request_kwargs: dict) -> str:
+    """Non-streaming completion for providers that do not support streaming."""
     response = await client.chat.completions.create(
         **request_kwargs,
     )
@@ -209,7 +305,7 @@ def _auto_fix(definition: dict) -> dict:
     # Force mode_id uppercase
     mode_id = definition.get("mode_id", "")
     if isinstance(mode_id, str):
-        mode_id = re.sub(r"[^A-Z0-9_]", "_", mode_id.upper())
+        mode_id = _MODE_ID_INVALID_RE.sub("_", mode_id.upper())
         if not mode_id or not mode_id[0].isalpha():
             mode_id = "MY_" + mode_id
         definition["mode_id"] = mode_id[:32]
@@ -255,12 +351,39 @@ def _auto_fix(definition: dict) -> dict:
     return definition
 
 
+def _generation_cache_key(
+    description: str,
+    provider: str,
+    model: str,
+    cache_scope: str,
+    api_key: str | None = None,
+    base_url: str | None = None,
+) -> str:
+    normalized = " ".join((description or "").split()).lower()
+    parts = (cache_scope, api_key or "", base_url or "", provider, model, normalized)
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _generation_cache_get(key: str) -> dict | None:
+    entry = _generation_cache.get(key)
+    if entry is None:
+        return None
+    definition, ts = entry
+    if time.time() - ts >= _GENERATION_CACHE_TTL:
+        del _generation_cache[key]
+        return None
+    return copy.deepcopy(definition)
+
+
+def _generation_cache_set(key: str, definition: dict) -> None:
+    if len(_generation_cache) >= _GENERATION_CACHE_MAX:
+        # Evict the oldest entry (dicts keep insertion order).
+        _generation_cache.pop(next(iter(_generation_cache)))
+    _generation_cache[key] = (copy.deepcopy(definition), time.time())
+
+
 def _is_image_generation_request(description: str) -> bool:
-    text = (description or "").lower()
-    for pattern in IMAGE_INTENT_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    return False
+    return _IMAGE_INTENT_RE.search(description or "") is not None
 
 
 def _force_image_gen_mode(definition: dict) -> dict:
@@ -302,15 +425,32 @@ async def generate_mode_definition(
     model: str = "deepseek-chat",
     api_key: str | None = None,
     base_url: str | None = None,
+    cache_scope: str | None = None,
+    regenerate: bool = False,
 ) -> dict:
     """Generate a mode JSON definition from natural language description.
 
+    Results are cached per ``cache_scope`` (the caller's identity) and
+    credentials; calls without a scope, with a reference image, or with
+    ``regenerate`` set always go to the LLM.
+
     Returns dict with keys: ok, mode_def (on success), error (on failure),
     warning (optional).
     """
     warning = None
     prefer_image_gen = _is_image_generation_request(description)
 
+    cache_key = None
+    if cache_scope and not image_base64:
+        cache_key = _generation_cache_key(
+            description, provider, model, cache_scope, api_key=api_key, base_url=base_url,
+        )
+    if cache_key and not regenerate:
+        cached = _generation_cache_get(cache_key)
+        if cached is not None:
+            logger.info("[MODE_GEN] Cache hit for %s/%s", provider, model)
+            return {"ok": True, "mode_def": cached}
+
     # Check vision support
     if image_base64 and not _supports_vision(provider, model):
         warning = "当前模型不支持图片输入，已忽略上传的图片"
@@ -331,7 +471,7 @@ async def generate_mode_definition(
     # Clean and parse
     cleaned = _clean_json_response(raw_text)
     try:
-        definition = json.loads(cleaned)
+        definition = _json_loads(cleaned)
     except json.JSONDecodeError as e:
         logger.warning(f"[MODE_GEN] Invalid JSON from LLM: {e}")
         return {
@@ -357,6 +497,8 @@ async def generate_mode_definition(
             "mode_def": definition,
         }
 
+    if cache_key:
+        _generation_cache_set(cache_key, definition)
     result = {"ok": True, "mode_def": definition}
     if warning:
         result["warning"] = warning
@@ -7,14 +7,29 @@ from __future__ import annotations
 import json
 import logging
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Awaitable, Callable
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping
 
 from PIL import Image
 
+try:
+    import orjson
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+    # catching the stdlib exception.
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; on 3.9 the classes keep a __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ContentContext:
     """统一的 Python 内置模式内容生成上下文。"""
     config: dict
@@ -45,7 +60,7 @@ CUSTOM_JSON_DIR = os.path.join(MODES_DIR, "custom")
 SCHEMA_PATH = os.path.join(MODES_DIR, "schema", "mode_schema.json")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ModeInfo:
     mode_id: str
     display_name: str
@@ -56,14 +71,14 @@ class ModeInfo:
     settings_schema: list[dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BuiltinMode:
     info: ModeInfo
     content_fn: ContentFn
     render_fn: RenderFn
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class JsonMode:
     info: ModeInfo
     definition: dict = field(default_factory=dict)
@@ -74,11 +89,28 @@ class JsonMode:
 class ModeRegistry:
     """Central registry for all display modes (builtin Python + JSON-defined)."""
 
+    __slots__ = ("_builtin", "_json_modes", "_en_json_modes", "_device_modes", "_version", "_derived")
+
     def __init__(self) -> None:
         self._builtin: dict[str, BuiltinMode] = {}
         self._json_modes: dict[str, JsonMode] = {}  # mode_id -> JsonMode
         self._en_json_modes: dict[str, JsonMode] = {}  # mode_id -> English JsonMode
         self._device_modes: dict[str, set[str]] = {}  # mac -> set of mode_ids
+        # Bumped on every change to _builtin/_json_modes; derived views below
+        # are memoized against it.
+        self._version = 0
+        self._derived: dict[str, tuple[int, Any]] = {}
+
+    def _changed(self) -> None:
+        self._version += 1
+
+    def _memo(self, name: str, build: Callable[[], Any]) -> Any:
+        hit = self._derived.get(name)
+        if hit is not None and hit[0] == self._version:
+            return hit[1]
+        value = build()
+        self._derived[name] = (self._version, value)
+        return value
 
     # ── Registration ─────────────────────────────────────────
 
@@ -105,17 +137,19 @@ class ModeRegistry:
         self._builtin[mode_id] = BuiltinMode(
             info=info, content_fn=content_fn, render_fn=render_fn
         )
+        self._changed()
         logger.debug(f"[Registry] Registered builtin mode: {mode_id}")
 
     def load_json_mode(self, path: str, *, source: str = "custom") -> str | None:
         """Load and validate a single JSON mode definition. Returns mode_id or None on error."""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                definition = json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
+            definition = _read_json_file(path)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
             logger.error(f"[Registry] Failed to load {path}: {e}")
             return None
+        return self._register_json_definition(path, definition, source=source)
 
+    def _register_json_definition(self, path: str, definition: dict, *, source: str) -> str | None:
         mode_id = definition.get("mode_id", "").upper()
         if not mode_id:
             logger.error(f"[Registry] Missing mode_id in {path}")
@@ -143,19 +177,18 @@ class ModeRegistry:
         self._json_modes[mode_id] = JsonMode(
             info=info, definition=definition, file_path=path
         )
+        self._changed()
         logger.info(f"[Registry] Loaded JSON mode: {mode_id} from {path}")
         return mode_id
 
     def load_directory(self, dir_path: str, *, source: str = "custom") -> list[str]:
         """Load all .json files from a directory. Returns list of loaded mode_ids."""
         loaded = []
-        if not os.path.isdir(dir_path):
-            return loaded
-        for fname in sorted(os.listdir(dir_path)):
-            if not fname.endswith(".json"):
+        for path, definition in _read_json_dir(dir_path):
+            if isinstance(definition, Exception):
+                logger.error(f"[Registry] Failed to load {path}: {definition}")
                 continue
-            path = os.path.join(dir_path, fname)
-            mid = self.load_json_mode(path, source=source)
+            mid = self._register_json_definition(path, definition, source=source)
             if mid:
                 loaded.append(mid)
         return loaded
@@ -163,17 +196,9 @@ class ModeRegistry:
     def load_en_directory(self, dir_path: str) -> list[str]:
         """Load English mode overrides from a directory into _en_json_modes."""
         loaded = []
-        if not os.path.isdir(dir_path):
-            return loaded
-        for fname in sorted(os.listdir(dir_path)):
-            if not fname.endswith(".json"):
-                continue
-            path = os.path.join(dir_path, fname)
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    definition = json.load(f)
-            except (json.JSONDecodeError, OSError) as e:
-                logger.error(f"[Registry] Failed to load EN mode {path}: {e}")
+        for path, definition in _read_json_dir(dir_path):
+            if isinstance(definition, Exception):
+                logger.error(f"[Registry] Failed to load EN mode {path}: {definition}")
                 continue
             mode_id = definition.get("mode_id", "").upper()
             if not mode_id or not _validate_mode_def(definition):
@@ -198,7 +223,7 @@ class ModeRegistry:
 
     def unregister_custom(self, mode_id: str, mac: str | None = None) -> bool:
         """Unregister a custom mode. If mac is provided, only unregister if it matches."""
-        mode_id = mode_id.upper()
+        mode_id = _upper_id(mode_id)
         jm = self._json_modes.get(mode_id)
         if jm and jm.info.source == "custom":
             # Normalize mac to uppercase for comparison
@@ -210,6 +235,7 @@ class ModeRegistry:
                     if not self._device_modes[jm.mac]:
                         del self._device_modes[jm.mac]
                 del self._json_modes[mode_id]
+                self._changed()
                 return True
         return False
     
@@ -256,6 +282,7 @@ class ModeRegistry:
         self._json_modes[mode_id] = JsonMode(
             info=info, definition=definition, file_path="", mac=normalized_mac
         )
+        self._changed()
         # Track mode for device
         if normalized_mac:
             if normalized_mac not in self._device_modes:
@@ -297,7 +324,7 @@ class ModeRegistry:
 
     def is_supported(self, mode_id: str, mac: str | None = None) -> bool:
         """Check if a mode is supported. If mac is provided, only check modes for that device."""
-        mode_id = mode_id.upper()
+        mode_id = _upper_id(mode_id)
         if mode_id in self._builtin:
             return True
         jm = self._json_modes.get(mode_id)
@@ -311,32 +338,30 @@ class ModeRegistry:
             return True
         return False
 
-    def get_supported_ids(self) -> set[str]:
-        return set(self._builtin.keys()) | set(self._json_modes.keys())
+    def get_supported_ids(self) -> frozenset[str]:
+        return self._memo("supported", lambda: frozenset(self._builtin).union(self._json_modes))
 
-    def get_cacheable_ids(self) -> set[str]:
-        ids: set[str] = set()
-        for mid, bm in self._builtin.items():
-            if bm.info.cacheable:
-                ids.add(mid)
-        for mid, jm in self._json_modes.items():
-            if jm.info.cacheable:
-                ids.add(mid)
-        return ids
+    def get_cacheable_ids(self) -> frozenset[str]:
+        def build() -> frozenset[str]:
+            return frozenset(
+                [mid for mid, bm in self._builtin.items() if bm.info.cacheable]
+                + [mid for mid, jm in self._json_modes.items() if jm.info.cacheable]
+            )
+        return self._memo("cacheable", build)
 
     def get_mode_info(self, mode_id: str) -> ModeInfo | None:
-        mode_id = mode_id.upper()
+        mode_id = _upper_id(mode_id)
         if mode_id in self._builtin:
             return self._builtin[mode_id].info
         jm = self._json_modes.get(mode_id)
         return jm.info if jm else None
 
     def get_builtin(self, mode_id: str) -> BuiltinMode | None:
-        return self._builtin.get(mode_id.upper())
+        return self._builtin.get(_upper_id(mode_id))
 
     def get_json_mode(self, mode_id: str, mac: str | None = None, *, language: str = "zh") -> JsonMode | None:
         """Get a JSON mode. If language is 'en', prefer English override."""
-        uid = mode_id.upper()
+        uid = _upper_id(mode_id)
         if language == "en":
             en_jm = self._en_json_modes.get(uid)
             if en_jm:
@@ -349,10 +374,10 @@ class ModeRegistry:
         return jm
 
     def is_json_mode(self, mode_id: str) -> bool:
-        return mode_id.upper() in self._json_modes
+        return _upper_id(mode_id) in self._json_modes
 
     def is_builtin(self, mode_id: str) -> bool:
-        return mode_id.upper() in self._builtin
+        return _upper_id(mode_id) in self._builtin
 
     def list_modes(self, mac: str | None = None) -> list[ModeInfo]:
         """List all modes. If mac is provided, only return modes for that device."""
@@ -368,18 +393,59 @@ class ModeRegistry:
             infos.append(jm.info)
         return sorted(infos, key=lambda m: m.mode_id)
 
-    def get_mode_icon_map(self) -> dict[str, str]:
-        result: dict[str, str] = {}
-        for mid, bm in self._builtin.items():
-            result[mid] = bm.info.icon
-        for mid, jm in self._json_modes.items():
-            result[mid] = jm.info.icon
-        return result
+    def get_mode_icon_map(self) -> Mapping[str, str]:
+        """Read-only mode_id -> icon map, shared between calls until the registry changes."""
+        def build() -> Mapping[str, str]:
+            result = {mid: bm.info.icon for mid, bm in self._builtin.items()}
+            result.update((mid, jm.info.icon) for mid, jm in self._json_modes.items())
+            return MappingProxyType(result)
+        return self._memo("icon_map", build)
+
+
+def _upper_id(mode_id: str) -> str:
+    """Uppercase a mode id; ids usually arrive uppercase, so skip the copy then."""
+    return mode_id if mode_id.isupper() else mode_id.upper()
+
+
+# ── File loading ─────────────────────────────────────────────
+
+
+def _read_json_file(path: str) -> dict:
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _read_json_or_error(path: str) -> dict | Exception:
+    try:
+        return _read_json_file(path)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+        return e
+
+
+def _read_json_dir(dir_path: str) -> list[tuple[str, dict | Exception]]:
+    """Read every .json file in a directory concurrently, in filename order.
+
+    Each entry holds the parsed definition or the load error, so callers can
+    register results on the calling thread.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            paths = sorted(e.path for e in it if e.name.endswith(".json") and e.is_file())
+    except OSError:
+        return []
+    if len(paths) < 2:
+        return [(p, _read_json_or_error(p)) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        return list(zip(paths, pool.map(_read_json_or_error, paths)))
 
 
 # ── Validation ───────────────────────────────────────────────
 
 
+_CONTENT_TYPES = frozenset({"llm", "llm_json", "static", "external_data", "image_gen", "computed", "composite"})
+_LLM_CONTENT_TYPES = frozenset({"llm", "llm_json"})
+
+
 def _validate_mode_def(definition: dict) -> bool:
     """Lightweight validation without jsonschema dependency."""
     mode_id = definition.get("mode_id", "")
@@ -390,11 +456,9 @@ def _validate_mode_def(definition: dict) -> bool:
     if not isinstance(content, dict):
         return False
     ctype = content.get("type", "")
-    if ctype not in ("llm", "llm_json", "static", "external_data", "image_gen", "computed", "composite"):
-        return False
-    if ctype in ("llm", "llm_json") and not content.get("prompt_template"):
+    if not isinstance(ctype, str) or ctype not in _CONTENT_TYPES:
         return False
-    if ctype in ("llm", "llm_json") and not content.get("fallback"):
+    if ctype in _LLM_CONTENT_TYPES and not (content.get("prompt_template") and content.get("fallback")):
         return False
 
     layout = definition.get("layout")
@@ -409,9 +473,8 @@ def _validate_mode_def(definition: dict) -> bool:
     if overrides is not None:
         if not isinstance(overrides, dict):
             return False
-        for key, val in overrides.items():
-            if not isinstance(val, dict):
-                return False
+        if not all(isinstance(val, dict) for val in overrides.values()):
+            return False
 
     return True
 
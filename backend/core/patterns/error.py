@@ -3,8 +3,10 @@ ERROR 模式 - 错误显示
 当服务不可用时显示错误信息
 """
 
+from functools import lru_cache
+
 from PIL import Image, ImageDraw
-from .utils import SCREEN_W, SCREEN_H, EINK_BG, EINK_FG, apply_text_fontmode, load_font
+from .utils import SCREEN_W, SCREEN_H, EINK_BG, EINK_FG, apply_text_fontmode, load_font, text_bbox
 
 
 def draw_warning_triangle(draw: ImageDraw.ImageDraw, cx: int, cy: int, size: int = 40):
@@ -14,7 +16,6 @@ def draw_warning_triangle(draw: ImageDraw.ImageDraw, cx: int, cy: int, size: int
     bl = (cx - half, cy + half // 2 + 4)
     br = (cx + half, cy + half // 2 + 4)
     draw.polygon([top, bl, br], outline=EINK_FG)
-    draw.polygon([top, bl, br], outline=EINK_FG)
     inset = 2
     top2 = (cx, cy - half + inset + 1)
     bl2 = (cx - half + inset + 1, cy + half // 2 + 4 - inset)
@@ -24,37 +25,48 @@ def draw_warning_triangle(draw: ImageDraw.ImageDraw, cx: int, cy: int, size: int
     draw.rectangle([cx - 1, cy + 8, cx + 1, cy + 10], fill=EINK_FG)
 
 
-def render_error(
-    mac: str = "A1:B2:C3:D4",
-    voltage: str = "3.25V",
-    retry_min: int = 60,
-    screen_w: int = SCREEN_W,
-    screen_h: int = SCREEN_H,
-) -> Image.Image:
-    """渲染错误页面"""
+@lru_cache(maxsize=8)
+def _error_scaffold(screen_w: int, screen_h: int) -> Image.Image:
+    """Static part of the error page (icon, title, detail) for one screen size."""
     img = Image.new("1", (screen_w, screen_h), EINK_BG)
     draw = ImageDraw.Draw(img)
     apply_text_fontmode(draw)
 
     font_title = load_font("inter_medium", 16)
     font_detail = load_font("inter_medium", 11)
-    font_info = load_font("inter_medium", 10)
 
     icon_cy = screen_h // 2 - 50
     draw_warning_triangle(draw, screen_w // 2, icon_cy)
 
     title = "Service Unavailable"
-    bbox = font_title.getbbox(title)
+    bbox = text_bbox(font_title, title)
     x = (screen_w - (bbox[2] - bbox[0])) // 2
     draw.text((x, icon_cy + 34), title, fill=EINK_FG, font=font_title)
 
     detail = "Unable to reach InkSight cloud service."
-    bbox2 = font_detail.getbbox(detail)
+    bbox2 = text_bbox(font_detail, detail)
     x2 = (screen_w - (bbox2[2] - bbox2[0])) // 2
     draw.text((x2, icon_cy + 62), detail, fill=EINK_FG, font=font_detail)
+    return img
+
+
+def render_error(
+    mac: str = "A1:B2:C3:D4",
+    voltage: str = "3.25V",
+    retry_min: int = 60,
+    screen_w: int = SCREEN_W,
+    screen_h: int = SCREEN_H,
+) -> Image.Image:
+    """渲染错误页面"""
+    img = _error_scaffold(screen_w, screen_h).copy()
+    draw = ImageDraw.Draw(img)
+    apply_text_fontmode(draw)
+
+    font_info = load_font("inter_medium", 10)
+    icon_cy = screen_h // 2 - 50
 
     info = f"MAC: {mac}  |  {voltage}  |  Retry in {retry_min}min"
-    bbox3 = font_info.getbbox(info)
+    bbox3 = text_bbox(font_info, info)
     x3 = (screen_w - (bbox3[2] - bbox3[0])) // 2
     draw.text((x3, icon_cy + 82), info, fill=EINK_FG, font=font_info)
 
@@ -8,6 +8,7 @@ import logging
 import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 
 logger = logging.getLogger(__name__)
@@ -93,6 +94,7 @@ def _bitmap_candidates(font_name: str, size: int) -> list[str]:
     ]
 
 
+@lru_cache(maxsize=64)
 def _load_bitmap_font(font_name: str, size: int) -> ImageFont.ImageFont | None:
     if size > _bitmap_max_request_size:
         return None
@@ -113,6 +115,14 @@ def _load_bitmap_font(font_name: str, size: int) -> ImageFont.ImageFont | None:
     return None
 
 
+# Latin-only faces never need complex shaping; the basic layout engine skips
+# Raqm/HarfBuzz for them when Pillow is built with it.
+_LATIN_FONT_KEYS = frozenset({"lora_regular", "lora_bold", "inter_medium"})
+
+
+# Font objects are immutable once loaded, so every render shares them instead
+# of reopening and parsing the font file.
+@lru_cache(maxsize=128)
 def load_font(font_key: str, size: int) -> ImageFont.ImageFont:
     """从配置加载字体"""
     font_name = FONTS.get(font_key)
@@ -130,6 +140,8 @@ def load_font(font_key: str, size: int) -> ImageFont.ImageFont:
     path = os.path.join(TRUETYPE_DIR, font_name)
     if os.path.exists(path):
         try:
+            if font_key in _LATIN_FONT_KEYS:
+                return ImageFont.truetype(path, size, layout_engine=ImageFont.Layout.BASIC)
             return ImageFont.truetype(path, size)
         except Exception as e:
             logger.warning(f"[FONT] Failed to load {font_name}: {e}")
@@ -149,6 +161,7 @@ def load_font(font_key: str, size: int) -> ImageFont.ImageFont:
     return ImageFont.load_default()
 
 
+@lru_cache(maxsize=64)
 def load_font_by_name(name: str, size: int) -> ImageFont.ImageFont:
     """直接通过文件名加载字体（兼容旧代码）"""
     if _force_bitmap:
@@ -166,27 +179,42 @@ def load_font_by_name(name: str, size: int) -> ImageFont.ImageFont:
     return ImageFont.load_default()
 
 
+@lru_cache(maxsize=4096)
+def text_bbox(font: ImageFont.ImageFont, text: str, mode: str = "") -> tuple[int, int, int, int]:
+    """font.getbbox memoized per (font, text); load_font shares font objects across renders.
+
+    Pass ``draw.fontmode`` as ``mode`` to match ``draw.textbbox((0, 0), ...)``
+    for single-line text.
+    """
+    return font.getbbox(text, mode) if mode else font.getbbox(text)
+
+
+_ALPHA_INK_LUT = [0 if a > 128 else 255 for a in range(256)]
+
+
 def rgba_to_mono(
     img: Image.Image, target_size: tuple[int, int] | None = None
 ) -> Image.Image:
     """Convert an RGBA icon to monochrome (mode '1'), optionally resizing."""
     if target_size:
         img = img.resize(target_size, Image.LANCZOS)
-    img = img.convert("RGBA")
-    mono = Image.new("1", img.size, 1)
-    for x in range(img.width):
-        for y in range(img.height):
-            _, _, _, a = img.getpixel((x, y))
-            if a > 128:
-                mono.putpixel((x, y), 0)
-    return mono
+    # Opaque-enough pixels become ink in one LUT pass over the alpha channel.
+    return img.convert("RGBA").getchannel("A").point(_ALPHA_INK_LUT, "1")
 
 
 def load_icon(name: str, size: tuple[int, int] | None = None) -> Image.Image | None:
     """Load a PNG icon from ICONS_DIR, convert to monochrome, optionally resize."""
+    icon = _load_icon_cached(name, tuple(size) if size else None)
+    return icon.copy() if icon is not None else None
+
+
+@lru_cache(maxsize=128)
+def _load_icon_cached(name: str, size: tuple[int, int] | None) -> Image.Image | None:
     path = os.path.join(ICONS_DIR, f"{name}.png")
     if os.path.exists(path):
         img = Image.open(path)
+        # Decode now so the cached icon holds pixels, not an open file.
+        img.load()
         if img.mode == "1":
             if size:
                 img = img.resize(size, Image.LANCZOS)
@@ -225,6 +253,18 @@ def get_mode_icon(mode: str) -> Image.Image | None:
     return None
 
 
+@lru_cache(maxsize=64)
+def _dash_mask(length: int, dash_len: int, gap_len: int) -> Image.Image:
+    """1-row mask matching draw_dashed_line's segments (each dash end is inclusive)."""
+    row = bytearray(length + 1)
+    x = 0
+    while x < length:
+        seg_end = min(x + dash_len, length)
+        row[x:seg_end + 1] = b"\xff" * (seg_end + 1 - x)
+        x += dash_len + gap_len
+    return Image.frombytes("L", (length + 1, 1), bytes(row))
+
+
 def draw_dashed_line(
     draw: ImageDraw.ImageDraw,
     start: tuple,
@@ -237,6 +277,12 @@ def draw_dashed_line(
     """Draw a horizontal dashed line (for zen/faded style)."""
     x0, y0 = start
     x1, _ = end
+    if x1 <= x0:
+        return
+    if width == 1:
+        # One bitmap blit instead of a draw.line call per dash.
+        draw.bitmap((x0, y0), _dash_mask(x1 - x0, dash_len, gap_len), fill=fill)
+        return
     x = x0
     while x < x1:
         seg_end = min(x + dash_len, x1)
@@ -244,6 +290,16 @@ def draw_dashed_line(
         x += dash_len + gap_len
 
 
+def status_bar_hour(time_str: str = "") -> int:
+    """Hour shown by the status-bar period label: from ``HH:...`` or the wall clock."""
+    match = re.match(r"^\s*(\d{1,2})\s*:", time_str or "")
+    if match:
+        parsed_hour = int(match.group(1))
+        if 0 <= parsed_hour <= 23:
+            return parsed_hour
+    return datetime.now().hour
+
+
 def draw_status_bar(
     draw: ImageDraw.ImageDraw,
     img: Image.Image,
@@ -273,15 +329,7 @@ def draw_status_bar(
             period_font = load_font("noto_serif_regular", period_font_size)
     font_en = load_font("inter_medium", int(FONT_SIZES["status_bar"]["en"] * scale))
 
-    match = re.match(r"^\s*(\d{1,2})\s*:", time_str or "")
-    hour = datetime.now().hour
-    if match:
-        try:
-            parsed_hour = int(match.group(1))
-            if 0 <= parsed_hour <= 23:
-                hour = parsed_hour
-        except ValueError:
-            pass
+    hour = status_bar_hour(time_str)
 
     if is_en:
         if hour >= 23 or hour < 5:
@@ -316,7 +364,7 @@ def draw_status_bar(
     y = pad_y
     x = pad_x
     draw.text((x, y), period_label, fill=EINK_FG, font=period_font)
-    bbox_period = draw.textbbox((0, 0), period_label, font=period_font)
+    bbox_period = text_bbox(period_font, period_label, draw.fontmode)
     x += (bbox_period[2] - bbox_period[0]) + int(8 * scale)
     draw.text((x, y), date_str, fill=EINK_FG, font=font_date)
 
@@ -330,7 +378,7 @@ def draw_status_bar(
         draw.text((wx, y), weather_str, fill=EINK_FG, font=font_date)
 
     batt_text = f"{battery_pct}%"
-    bbox = draw.textbbox((0, 0), batt_text, font=font_en)
+    bbox = text_bbox(font_en, batt_text, draw.fontmode)
     batt_text_w = bbox[2] - bbox[0]
 
     batt_fill = EINK_FG
@@ -359,9 +407,12 @@ def draw_status_bar(
         draw.line([(0, line_y), (screen_w, line_y)], fill=EINK_FG, width=line_width)
 
 
+_CJK_RE = re.compile("[\u3400-\u4dbf\u4e00-\u9fff]")
+
+
 def has_cjk(text: str) -> bool:
     """Check if text contains CJK (Chinese/Japanese/Korean) characters."""
-    return any("\u4e00" <= ch <= "\u9fff" or "\u3400" <= ch <= "\u4dbf" for ch in text)
+    return _CJK_RE.search(text) is not None
 
 
 def draw_footer(
@@ -422,7 +473,10 @@ def draw_footer(
     draw.text((label_x, y_line + int(9 * scale)), mode.upper(), fill=EINK_FG, font=font_label)
 
     if attribution:
-        bbox = draw.textbbox((0, 0), attribution, font=font_attr)
+        if "\n" in attribution:
+            bbox = draw.textbbox((0, 0), attribution, font=font_attr)
+        else:
+            bbox = text_bbox(font_attr, attribution, draw.fontmode)
         draw.text(
             (screen_w - int(12 * scale) - (bbox[2] - bbox[0]), y_line + int(9 * scale)),
             attribution,
@@ -433,21 +487,102 @@ def draw_footer(
 
 def wrap_text(text: str, font: ImageFont.ImageFont, max_width: int) -> list[str]:
     """文本换行"""
+    return list(_wrap_text_cached(text, font, max_width))
+
+
+@lru_cache(maxsize=1024)
+def _wrap_text_cached(text: str, font: ImageFont.ImageFont, max_width: int) -> tuple[str, ...]:
+    # Content changes far less often than screens render; load_font shares
+    # font objects, so (text, font, width) repeats across renders.
     lines = []
+    # CJK glyphs share one advance in the bundled faces, so a full-width
+    # em tells how many characters the first line probably holds.
+    em = text_bbox(font, "中")[2]
+    first_guess = max(1, max_width // em) if em > 0 else 8
     for paragraph in text.split("\n"):
-        words = list(paragraph)
-        current = ""
-        for ch in words:
-            test = current + ch
-            bbox = font.getbbox(test)
-            if bbox[2] > max_width:
-                if current:
-                    lines.append(current)
-                current = ch
-            else:
-                current = test
-        if current:
-            lines.append(current)
+        n = len(paragraph)
+        start = 0
+        guess = first_guess
+        while start < n:
+            # Longest slice from ``start`` whose ink still fits. The right
+            # edge only grows as characters are appended, so gallop from the
+            # previous line's length and bisect instead of measuring every
+            # prefix; a lone overwide character still gets its own line.
+            lo, hi = start, n + 1
+            probe = min(start + guess, n)
+            while hi - lo > 1:
+                if font.getbbox(paragraph[start:probe])[2] > max_width:
+                    hi = probe
+                else:
+                    lo = probe
+                probe = (lo + hi) // 2 if hi <= n else min(2 * lo - start, n)
+            end = max(lo, start + 1)
+            lines.append(paragraph[start:end])
+            guess = end - start
+            start = end
+    return tuple(lines)
+
+
+def _knuth_plass_breaks(widths: list[float], space_w: float, max_width: int) -> list[int] | None:
+    """Minimum-raggedness break points (Knuth–Plass without hyphenation).
+
+    Returns the start index of every line after the first, or None if some
+    token is wider than ``max_width`` on its own. The last line is free.
+    """
+    n = len(widths)
+    prefix = [0.0]
+    for w in widths:
+        prefix.append(prefix[-1] + w)
+    inf = float("inf")
+    best = [0.0] + [inf] * n
+    prev = [0] * (n + 1)
+    for j in range(1, n + 1):
+        for i in range(j - 1, -1, -1):
+            line_w = prefix[j] - prefix[i] + space_w * (j - i - 1)
+            if line_w > max_width:
+                break
+            slack = 0.0 if j == n else max_width - line_w
+            cost = best[i] + slack * slack
+            if cost < best[j]:
+                best[j] = cost
+                prev[j] = i
+        if best[j] == inf:
+            return None
+    breaks: list[int] = []
+    j = n
+    while j > 0:
+        j = prev[j]
+        if j > 0:
+            breaks.append(j)
+    breaks.reverse()
+    return breaks
+
+
+def wrap_text_balanced(text: str, font: ImageFont.ImageFont, max_width: int) -> list[str]:
+    """Wrap text minimising ragged line ends; falls back to wrap_text per paragraph.
+
+    Latin text breaks between words, CJK text between characters.
+    """
+    lines: list[str] = []
+    for paragraph in text.split("\n"):
+        if has_cjk(paragraph):
+            tokens, sep = list(paragraph), ""
+        else:
+            tokens, sep = paragraph.split(), " "
+        if not tokens:
+            continue
+        widths = [font.getlength(t) for t in tokens]
+        breaks = _knuth_plass_breaks(widths, font.getlength(sep) if sep else 0.0, max_width)
+        if breaks is None:
+            lines.extend(wrap_text(paragraph, font, max_width))
+            continue
+        bounds = [0, *breaks, len(tokens)]
+        wrapped = [sep.join(tokens[a:b]) for a, b in zip(bounds, bounds[1:])]
+        # Summed advances ignore kerning; re-check so nothing spills over.
+        if any(font.getlength(line) > max_width for line in wrapped):
+            lines.extend(wrap_text(paragraph, font, max_width))
+        else:
+            lines.extend(wrapped)
     return lines
 
 
@@ -469,6 +604,6 @@ def render_quote_body(
     y_start = 32 + (screen_h - 32 - 30 - total_h) // 2
 
     for i, line in enumerate(lines):
-        bbox = font.getbbox(line)
+        bbox = text_bbox(font, line)
         x = (screen_w - (bbox[2] - bbox[0])) // 2
         draw.text((x, y_start + i * line_h), line, fill=EINK_FG, font=font)
@@ -19,6 +19,7 @@ from .config import (
     DEFAULT_LANGUAGE,
     DEFAULT_CONTENT_TONE,
 )
+from . import json_content, json_renderer, mode_registry, renderer
 
 WEEKDAY_EN_SHORT = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 MONTH_EN_SHORT = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
@@ -111,8 +112,7 @@ async def generate_and_render(
         screen_h=screen_h,
     )
 
-    eff_cfg = get_effective_mode_config(config, persona)
-    _eff_lang = eff_cfg.get("mode_language", "") or DEFAULT_LANGUAGE
+    _eff_lang = cfg.get("mode_language", "") or DEFAULT_LANGUAGE
     date_str = _format_date_str(date_ctx, _eff_lang)
 
     img = _render_for_persona(
@@ -165,9 +165,7 @@ async def _generate_content_for_persona(
     screen_h: int = SCREEN_HEIGHT,
 ) -> dict:
     """Dispatch content generation to the appropriate handler."""
-    from .mode_registry import ContentContext, get_registry
-
-    registry = get_registry()
+    registry = mode_registry.get_registry()
 
     effective_language = cfg.get("mode_language", "") or DEFAULT_LANGUAGE
     date_str = _format_date_str(date_ctx, effective_language)
@@ -197,7 +195,7 @@ async def _generate_content_for_persona(
             len(user_image_api_key) if user_image_api_key else 0,
         )
 
-    ctx = ContentContext(
+    ctx = mode_registry.ContentContext(
         config=cfg,
         date_ctx=date_ctx,
         weather_str=weather_str,
@@ -218,7 +216,6 @@ async def _generate_content_for_persona(
 
     # JSON-defined mode
     if registry.is_json_mode(persona):
-        from .json_content import generate_json_mode_content
         jm = registry.get_json_mode(persona, mac, language=effective_language)
         if not jm:
             # Try to load from database if mode not in registry
@@ -236,7 +233,7 @@ async def _generate_content_for_persona(
                             jm = registry.get_json_mode(persona, mac, language=effective_language)
         if not jm:
             raise ValueError(f"JSON mode {persona} not found in registry")
-        return await generate_json_mode_content(
+        return await json_content.generate_json_mode_content(
             jm.definition,
             config=cfg,
             date_ctx=date_ctx,
@@ -286,11 +283,7 @@ def _render_for_persona(
     language: str = "zh",
 ) -> Image.Image:
     """Dispatch rendering to the appropriate handler."""
-    from .mode_registry import get_registry
-    from .renderer import render_mode
-    from .json_renderer import render_json_mode
-
-    registry = get_registry()
+    registry = mode_registry.get_registry()
 
     # JSON-defined mode
     if registry.is_json_mode(persona):
@@ -302,7 +295,7 @@ def _render_for_persona(
         else:
             weather_str_for_bar = weather_str
             weather_code_for_bar = weather_code
-        return render_json_mode(
+        return json_renderer.render_json_mode(
             jm.definition, content,
             date_str=date_str, weather_str=weather_str_for_bar, battery_pct=battery_pct,
             weather_code=weather_code_for_bar, time_str=time_str,
@@ -311,7 +304,7 @@ def _render_for_persona(
         )
 
     # Builtin Python mode - use original render_mode dispatcher
-    return render_mode(
+    return renderer.render_mode(
         persona, content,
         date_str=date_str, weather_str=weather_str, battery_pct=battery_pct,
         weather_code=weather_code, time_str=time_str, date_ctx=date_ctx,
@@ -96,9 +96,7 @@ def image_to_raw_2bpp(img: Image.Image) -> bytes:
 
 
 def image_to_png_bytes(img: Image.Image) -> bytes:
-    """将图像转换为 PNG 字节流"""
-    if img.mode == "1":
-        img = img.convert("L")
+    """将图像转换为 PNG 字节流（1-bit 图像直接以 1-bit 灰度 PNG 编码）"""
     buf = io.BytesIO()
     img.save(buf, format="PNG")
     return buf.getvalue()
@@ -111,7 +111,7 @@ class ConfigRequest(BaseModel):
             m = mode.upper().strip()
             # 允许 CUSTOM_* / MY_* 透传，避免误判导致 422/500
             if not (m.startswith("CUSTOM_") or m.startswith("MY_") or m in supported):
-                raise ValueError(f"不支持的模式: {mode}，可选: {supported}")
+                raise ValueError(f"不支持的模式: {mode}，可选: {', '.join(sorted(supported))}")
             cleaned.append(m)
         return cleaned
 
@@ -4,11 +4,15 @@ Stores render logs, content history, and device heartbeats in SQLite.
 """
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import os
 import logging
+import weakref
 import aiosqlite
+from collections import Counter
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
 
@@ -18,10 +22,77 @@ from .db import get_main_db
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "..", "inksight.db")
 
+# One long-lived connection per event loop; stats calls are frequent and
+# tiny, so reopening the file each time dominated their cost.
+_stats_dbs: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_write_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Retention caps are enforced on the first write per device and then every
+# _PRUNE_EVERY writes, so tables may briefly hold up to cap + _PRUNE_EVERY rows.
+_HEARTBEAT_RETENTION = 1000
+_CONTENT_HISTORY_RETENTION = 500
+_PRUNE_EVERY = 100
+_prune_counters: dict[tuple[str, str], int] = {}
+
+# Render logs are buffered per event loop and written in one transaction
+# once _RENDER_LOG_BATCH rows queue up or _RENDER_LOG_FLUSH_DELAY elapses.
+# Readers of render_logs flush first so they always see their own writes.
+_RENDER_LOG_BATCH = 64
+_RENDER_LOG_FLUSH_DELAY = 0.25
+_render_log_buffers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_render_log_flushers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _should_prune(table: str, mac: str) -> bool:
+    key = (table, mac)
+    count = _prune_counters.get(key, 0)
+    _prune_counters[key] = (count + 1) % _PRUNE_EVERY
+    return count == 0
+
+
+def _write_lock() -> asyncio.Lock:
+    """Serialize write transactions on the shared connection."""
+    loop = asyncio.get_running_loop()
+    lock = _write_locks.get(loop)
+    if lock is None:
+        lock = asyncio.Lock()
+        _write_locks[loop] = lock
+    return lock
+
+
+@asynccontextmanager
+async def _write_txn():
+    """One write transaction on the shared connection: commit, or roll back on error."""
+    db = await _get_db()
+    async with _write_lock():
+        try:
+            yield db
+        except BaseException:
+            await db.rollback()
+            raise
+        await db.commit()
+
+
+async def _get_db():
+    """Return the shared stats connection bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    db = _stats_dbs.get(loop)
+    if db is not None and not db.closed:
+        return db
+    async with _write_lock():
+        db = _stats_dbs.get(loop)
+        if db is None or db.closed:
+            db = await get_main_db()
+            # WAL is already on; NORMAL syncs only at checkpoints, so each
+            # stats commit is a single WAL append instead of an fsync.
+            await db.execute("PRAGMA synchronous=NORMAL")
+            await db.execute("PRAGMA mmap_size=268435456")
+            _stats_dbs[loop] = db
+    return db
+
 
 async def init_stats_db():
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute("PRAGMA journal_mode=WAL")
+    async with _write_txn() as db:
         await db.execute("""
             CREATE TABLE IF NOT EXISTS render_logs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -55,6 +126,21 @@ async def init_stats_db():
                 created_at TEXT NOT NULL
             )
         """)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS render_daily_counts (
+                mac TEXT NOT NULL,
+                day TEXT NOT NULL,
+                cnt INTEGER DEFAULT 0,
+                PRIMARY KEY (mac, day)
+            )
+        """)
+        # Backfill the rollup once for databases that predate it
+        await db.execute("""
+            INSERT INTO render_daily_counts (mac, day, cnt)
+            SELECT mac, DATE(created_at), COUNT(*) FROM render_logs
+            WHERE NOT EXISTS (SELECT 1 FROM render_daily_counts)
+            GROUP BY mac, DATE(created_at)
+        """)
         await db.execute("""
             CREATE TABLE IF NOT EXISTS habit_records (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -66,10 +152,16 @@ async def init_stats_db():
                 UNIQUE(mac, habit_name, date)
             )
         """)
-        await db.execute("CREATE INDEX IF NOT EXISTS idx_render_logs_mac ON render_logs(mac)")
+        # Per-device reads filter on mac and order/group by created_at, so
+        # (mac, created_at) serves both; the mac-only indexes are redundant.
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_render_logs_mac_created ON render_logs(mac, created_at)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_render_logs_created ON render_logs(created_at)")
-        await db.execute("CREATE INDEX IF NOT EXISTS idx_heartbeats_mac ON device_heartbeats(mac)")
-        await db.execute("CREATE INDEX IF NOT EXISTS idx_content_history_mac ON content_history(mac)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_heartbeats_mac_created ON device_heartbeats(mac, created_at)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_content_history_mac_created ON content_history(mac, created_at)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_content_history_mode_created ON content_history(mac, mode_id, created_at)")
+        await db.execute("DROP INDEX IF EXISTS idx_render_logs_mac")
+        await db.execute("DROP INDEX IF EXISTS idx_heartbeats_mac")
+        await db.execute("DROP INDEX IF EXISTS idx_content_history_mac")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_content_history_hash ON content_history(mac, mode_id, content_hash)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_habit_mac ON habit_records(mac)")
         # Migration: add is_fallback column if missing (for existing databases)
@@ -77,7 +169,6 @@ async def init_stats_db():
             await db.execute("ALTER TABLE render_logs ADD COLUMN is_fallback INTEGER DEFAULT 0")
         except aiosqlite.OperationalError:
             pass  # column already exists
-        await db.commit()
 
 
 async def log_render(
@@ -88,38 +179,96 @@ async def log_render(
     status: str = "success",
     is_fallback: bool = False,
 ):
+    """Queue a render log row; rows are written in batches by flush_render_logs."""
     now = datetime.now().isoformat()
-    db = await get_main_db()
-    await db.execute(
-        """INSERT INTO render_logs (mac, persona, cache_hit, render_time_ms, status, is_fallback, created_at)
-           VALUES (?, ?, ?, ?, ?, ?, ?)""",
-        (mac, persona, int(cache_hit), render_time_ms, status, int(is_fallback), now),
-    )
-    await db.commit()
+    loop = asyncio.get_running_loop()
+    rows = _render_log_buffers.setdefault(loop, [])
+    rows.append((mac, persona, int(cache_hit), render_time_ms, status, int(is_fallback), now))
+    if len(rows) >= _RENDER_LOG_BATCH:
+        await flush_render_logs()
+    elif loop not in _render_log_flushers:
+        db = await _get_db()
+        if loop not in _render_log_flushers:
+            _render_log_flushers[loop] = loop.create_task(_flush_render_logs_later(db))
+
+
+async def _flush_render_logs_later(db):
+    await asyncio.sleep(_RENDER_LOG_FLUSH_DELAY)
+    loop = asyncio.get_running_loop()
+    _render_log_flushers.pop(loop, None)
+    if db.closed:
+        # The DB was shut down without flush_render_logs(); don't reopen it.
+        rows = _render_log_buffers.pop(loop, None) or []
+        logger.warning("[Stats] Dropped %d unflushed render logs", len(rows))
+        return
+    try:
+        await flush_render_logs()
+    except aiosqlite.Error:
+        logger.warning("[Stats] Failed to flush render logs", exc_info=True)
+
+
+async def flush_render_logs():
+    """Write queued render log rows in one transaction; also run on shutdown."""
+    loop = asyncio.get_running_loop()
+    flusher = _render_log_flushers.pop(loop, None)
+    if flusher is not None and flusher is not asyncio.current_task():
+        flusher.cancel()
+    rows = _render_log_buffers.pop(loop, None)
+    if not rows:
+        return
+    async with _write_txn() as db:
+        await db.executemany(
+            """INSERT INTO render_logs (mac, persona, cache_hit, render_time_ms, status, is_fallback, created_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            rows,
+        )
+        daily = Counter((row[0], row[6][:10]) for row in rows)
+        await db.executemany(
+            """INSERT INTO render_daily_counts (mac, day, cnt) VALUES (?, ?, ?)
+               ON CONFLICT(mac, day) DO UPDATE SET cnt = cnt + excluded.cnt""",
+            [(mac, day, cnt) for (mac, day), cnt in daily.items()],
+        )
+
+
+async def close_stats_db():
+    """Close the running loop's shared stats connection (app shutdown, tests).
+
+    Call flush_render_logs() first; rows still queued afterwards are dropped.
+    """
+    loop = asyncio.get_running_loop()
+    flusher = _render_log_flushers.pop(loop, None)
+    if flusher is not None:
+        flusher.cancel()
+    rows = _render_log_buffers.pop(loop, None)
+    if rows:
+        logger.warning("[Stats] Dropped %d unflushed render logs", len(rows))
+    db = _stats_dbs.pop(loop, None)
+    if db is not None:
+        await db.close()
 
 
 async def log_heartbeat(mac: str, battery_voltage: float, wifi_rssi: int | None = None):
     now = datetime.now().isoformat()
-    db = await get_main_db()
-    await db.execute(
-        """INSERT INTO device_heartbeats (mac, battery_voltage, wifi_rssi, created_at)
-           VALUES (?, ?, ?, ?)""",
-        (mac, battery_voltage, wifi_rssi, now),
-    )
-    # Keep only the latest 1000 heartbeats per device
-    await db.execute(
-        """DELETE FROM device_heartbeats
-           WHERE mac = ? AND id NOT IN (
-               SELECT id FROM device_heartbeats WHERE mac = ?
-               ORDER BY created_at DESC LIMIT 1000
-           )""",
-        (mac, mac),
-    )
-    await db.commit()
+    async with _write_txn() as db:
+        await db.execute(
+            """INSERT INTO device_heartbeats (mac, battery_voltage, wifi_rssi, created_at)
+               VALUES (?, ?, ?, ?)""",
+            (mac, battery_voltage, wifi_rssi, now),
+        )
+        # Keep only the latest heartbeats per device
+        if _should_prune("device_heartbeats", mac):
+            await db.execute(
+                """DELETE FROM device_heartbeats
+                   WHERE mac = ? AND id NOT IN (
+                       SELECT id FROM device_heartbeats WHERE mac = ?
+                       ORDER BY created_at DESC LIMIT ?
+                   )""",
+                (mac, mac, _HEARTBEAT_RETENTION),
+            )
 
 
 async def get_latest_battery_voltage(mac: str) -> float | None:
-    db = await get_main_db()
+    db = await _get_db()
     cursor = await db.execute(
         """SELECT battery_voltage FROM device_heartbeats
            WHERE mac = ? AND battery_voltage IS NOT NULL
@@ -133,7 +282,7 @@ async def get_latest_battery_voltage(mac: str) -> float | None:
 
 
 async def get_latest_heartbeat(mac: str) -> dict | None:
-    db = await get_main_db()
+    db = await _get_db()
     cursor = await db.execute(
         """SELECT battery_voltage, wifi_rssi, created_at FROM device_heartbeats
            WHERE mac = ?
@@ -152,74 +301,58 @@ async def get_latest_heartbeat(mac: str) -> dict | None:
 
 async def get_device_stats(mac: str) -> dict:
     """Get comprehensive stats for a device."""
-    db = await get_main_db()
-    # Total renders
-    cursor = await db.execute(
-        "SELECT COUNT(*) FROM render_logs WHERE mac = ?", (mac,)
+    await flush_render_logs()
+    db = await _get_db()
+    totals, modes, last, heartbeat_rows, daily_rows = await asyncio.gather(
+        # Totals, cache hits, errors and average render time in one scan
+        db.execute_fetchall(
+            """SELECT COUNT(*), SUM(cache_hit = 1), SUM(status = 'error'),
+                      AVG(CASE WHEN status = 'success' THEN render_time_ms END)
+               FROM render_logs WHERE mac = ?""",
+            (mac,),
+        ),
+        # Mode frequency
+        db.execute_fetchall(
+            """SELECT persona, COUNT(*) as cnt FROM render_logs
+               WHERE mac = ? GROUP BY persona ORDER BY cnt DESC""",
+            (mac,),
+        ),
+        # Last render
+        db.execute_fetchall(
+            "SELECT persona, created_at FROM render_logs WHERE mac = ? ORDER BY created_at DESC LIMIT 1",
+            (mac,),
+        ),
+        # Battery voltage trend (last 30 entries)
+        db.execute_fetchall(
+            """SELECT battery_voltage, wifi_rssi, created_at FROM device_heartbeats
+               WHERE mac = ? ORDER BY created_at DESC LIMIT 30""",
+            (mac,),
+        ),
+        # Daily render counts (last 30 days)
+        db.execute_fetchall(
+            """SELECT day, cnt FROM render_daily_counts
+               WHERE mac = ? ORDER BY day DESC LIMIT 30""",
+            (mac,),
+        ),
     )
-    total_renders = (await cursor.fetchone())[0]
 
-    # Cache hit rate
-    cursor = await db.execute(
-        "SELECT COUNT(*) FROM render_logs WHERE mac = ? AND cache_hit = 1", (mac,)
-    )
-    cache_hits = (await cursor.fetchone())[0]
+    total_renders, cache_hits, error_count, avg_render_time = totals[0]
+    cache_hits = cache_hits or 0
     cache_hit_rate = round(cache_hits / total_renders * 100, 1) if total_renders > 0 else 0
+    avg_render_time = round(avg_render_time or 0)
+    error_count = error_count or 0
 
-    # Mode frequency
-    cursor = await db.execute(
-        """SELECT persona, COUNT(*) as cnt FROM render_logs
-           WHERE mac = ? GROUP BY persona ORDER BY cnt DESC""",
-        (mac,),
-    )
-    mode_frequency = {row[0]: row[1] for row in await cursor.fetchall()}
+    mode_frequency = {row[0]: row[1] for row in modes}
+    last_render = {"persona": last[0][0], "time": last[0][1]} if last else None
 
-    # Last render
-    cursor = await db.execute(
-        "SELECT persona, created_at FROM render_logs WHERE mac = ? ORDER BY created_at DESC LIMIT 1",
-        (mac,),
-    )
-    last_render_row = await cursor.fetchone()
-    last_render = {"persona": last_render_row[0], "time": last_render_row[1]} if last_render_row else None
-
-    # Battery voltage trend (last 30 entries)
-    cursor = await db.execute(
-        """SELECT battery_voltage, wifi_rssi, created_at FROM device_heartbeats
-           WHERE mac = ? ORDER BY created_at DESC LIMIT 30""",
-        (mac,),
-    )
     heartbeats = [
         {"voltage": row[0], "rssi": row[1], "time": row[2]}
-        for row in await cursor.fetchall()
+        for row in reversed(heartbeat_rows)
     ]
-    heartbeats.reverse()
-
-    # Daily render counts (last 30 days)
-    cursor = await db.execute(
-        """SELECT DATE(created_at) as day, COUNT(*) as cnt
-           FROM render_logs WHERE mac = ?
-           GROUP BY day ORDER BY day DESC LIMIT 30""",
-        (mac,),
-    )
     daily_renders = [
         {"date": row[0], "count": row[1]}
-        for row in await cursor.fetchall()
+        for row in reversed(daily_rows)
     ]
-    daily_renders.reverse()
-
-    # Average render time
-    cursor = await db.execute(
-        "SELECT AVG(render_time_ms) FROM render_logs WHERE mac = ? AND status = 'success'",
-        (mac,),
-    )
-    avg_render_time = round((await cursor.fetchone())[0] or 0)
-
-    # Error count
-    cursor = await db.execute(
-        "SELECT COUNT(*) FROM render_logs WHERE mac = ? AND status = 'error'",
-        (mac,),
-    )
-    error_count = (await cursor.fetchone())[0]
 
     return {
         "mac": mac,
@@ -236,38 +369,31 @@ async def get_device_stats(mac: str) -> dict:
 
 async def get_stats_overview() -> dict:
     """Get global overview stats across all devices."""
-    db = await get_main_db()
-    # Total devices
-    cursor = await db.execute(
-        "SELECT COUNT(DISTINCT mac) FROM render_logs"
+    await flush_render_logs()
+    db = await _get_db()
+    totals, modes, device_rows = await asyncio.gather(
+        # Device count, total renders and cache hits in one scan
+        db.execute_fetchall(
+            "SELECT COUNT(DISTINCT mac), COUNT(*), SUM(cache_hit = 1) FROM render_logs"
+        ),
+        # Global mode frequency
+        db.execute_fetchall(
+            "SELECT persona, COUNT(*) as cnt FROM render_logs GROUP BY persona ORDER BY cnt DESC"
+        ),
+        # Recent active devices
+        db.execute_fetchall(
+            """SELECT mac, MAX(created_at) as last_seen, COUNT(*) as renders
+               FROM render_logs GROUP BY mac ORDER BY last_seen DESC LIMIT 20"""
+        ),
     )
-    total_devices = (await cursor.fetchone())[0]
 
-    # Total renders
-    cursor = await db.execute("SELECT COUNT(*) FROM render_logs")
-    total_renders = (await cursor.fetchone())[0]
-
-    # Global cache hit rate
-    cursor = await db.execute(
-        "SELECT COUNT(*) FROM render_logs WHERE cache_hit = 1"
-    )
-    cache_hits = (await cursor.fetchone())[0]
+    total_devices, total_renders, cache_hits = totals[0]
+    cache_hits = cache_hits or 0
     cache_hit_rate = round(cache_hits / total_renders * 100, 1) if total_renders > 0 else 0
-
-    # Global mode frequency
-    cursor = await db.execute(
-        "SELECT persona, COUNT(*) as cnt FROM render_logs GROUP BY persona ORDER BY cnt DESC"
-    )
-    mode_frequency = {row[0]: row[1] for row in await cursor.fetchall()}
-
-    # Recent active devices
-    cursor = await db.execute(
-        """SELECT mac, MAX(created_at) as last_seen, COUNT(*) as renders
-           FROM render_logs GROUP BY mac ORDER BY last_seen DESC LIMIT 20"""
-    )
+    mode_frequency = {row[0]: row[1] for row in modes}
     devices = [
         {"mac": row[0], "last_seen": row[1], "total_renders": row[2]}
-        for row in await cursor.fetchall()
+        for row in device_rows
     ]
 
     return {
@@ -281,7 +407,8 @@ async def get_stats_overview() -> dict:
 
 async def get_render_history(mac: str, limit: int = 50, offset: int = 0) -> list[dict]:
     """Get render history for a device with pagination."""
-    db = await get_main_db()
+    await flush_render_logs()
+    db = await _get_db()
     cursor = await db.execute(
         """SELECT persona, cache_hit, render_time_ms, status, created_at
            FROM render_logs WHERE mac = ?
@@ -335,27 +462,27 @@ async def save_render_content(mac: str, mode_id: str, content: dict | None):
     safe_content = _to_json_safe(content) if content else {}
     content_str = json.dumps(safe_content, ensure_ascii=False) if safe_content else "{}"
     content_hash = _compute_content_hash(safe_content)
-    db = await get_main_db()
-    await db.execute(
-        """INSERT INTO content_history (mac, mode_id, content, content_hash, created_at)
-           VALUES (?, ?, ?, ?, ?)""",
-        (mac, mode_id, content_str, content_hash, now),
-    )
-    await db.execute(
-        """DELETE FROM content_history
-           WHERE mac = ? AND id NOT IN (
-               SELECT id FROM content_history WHERE mac = ?
-               ORDER BY created_at DESC LIMIT 500
-           )""",
-        (mac, mac),
-    )
-    await db.commit()
+    async with _write_txn() as db:
+        await db.execute(
+            """INSERT INTO content_history (mac, mode_id, content, content_hash, created_at)
+               VALUES (?, ?, ?, ?, ?)""",
+            (mac, mode_id, content_str, content_hash, now),
+        )
+        if _should_prune("content_history", mac):
+            await db.execute(
+                """DELETE FROM content_history
+                   WHERE mac = ? AND id NOT IN (
+                       SELECT id FROM content_history WHERE mac = ?
+                       ORDER BY created_at DESC LIMIT ?
+                   )""",
+                (mac, mac, _CONTENT_HISTORY_RETENTION),
+            )
 
 
 async def get_content_history(
     mac: str, limit: int = 30, offset: int = 0, mode: str | None = None,
 ) -> list[dict]:
-    db = await get_main_db()
+    db = await _get_db()
     if mode:
         cursor = await db.execute(
             """SELECT id, mode_id, content, is_favorite, created_at
@@ -388,7 +515,7 @@ async def get_content_history(
 
 
 async def get_latest_render_content(mac: str) -> dict | None:
-    db = await get_main_db()
+    db = await _get_db()
     cursor = await db.execute(
         """SELECT mode_id, content FROM content_history
            WHERE mac = ? ORDER BY created_at DESC LIMIT 1""",
@@ -412,17 +539,16 @@ async def add_favorite(mac: str, mode_id: str, content_json: str | None):
         content_hash = _compute_content_hash(json.loads(content_str))
     except (json.JSONDecodeError, TypeError) as exc:
         logger.warning("[Stats] Failed to parse favorite content JSON for %s:%s", mac, mode_id, exc_info=True)
-    db = await get_main_db()
-    await db.execute(
-        """INSERT INTO content_history (mac, mode_id, content, content_hash, is_favorite, created_at)
-           VALUES (?, ?, ?, ?, 1, ?)""",
-        (mac, mode_id, content_str, content_hash, now),
-    )
-    await db.commit()
+    async with _write_txn() as db:
+        await db.execute(
+            """INSERT INTO content_history (mac, mode_id, content, content_hash, is_favorite, created_at)
+               VALUES (?, ?, ?, ?, 1, ?)""",
+            (mac, mode_id, content_str, content_hash, now),
+        )
 
 
 async def get_favorites(mac: str, limit: int = 30) -> list[dict]:
-    db = await get_main_db()
+    db = await _get_db()
     cursor = await db.execute(
         """SELECT id, mode_id, content, created_at FROM content_history
            WHERE mac = ? AND is_favorite = 1
@@ -447,7 +573,7 @@ async def get_favorites(mac: str, limit: int = 30) -> list[dict]:
 
 async def get_recent_content_hashes(mac: str, mode_id: str, limit: int = 20) -> list[str]:
     """Get recent content hashes for deduplication."""
-    db = await get_main_db()
+    db = await _get_db()
     cursor = await db.execute(
         """SELECT content_hash FROM content_history
            WHERE mac = ? AND mode_id = ? AND content_hash != ''
@@ -459,7 +585,7 @@ async def get_recent_content_hashes(mac: str, mode_id: str, limit: int = 20) ->
 
 async def get_recent_content_summaries(mac: str, mode_id: str, limit: int = 3) -> list[str]:
     """Get short summaries of recent content for LLM dedup hints."""
-    db = await get_main_db()
+    db = await _get_db()
     cursor = await db.execute(
         """SELECT content FROM content_history
            WHERE mac = ? AND mode_id = ?
@@ -484,14 +610,13 @@ async def check_habit(mac: str, habit_name: str, date: str | None = None):
     now = datetime.now()
     if not date:
         date = now.strftime("%Y-%m-%d")
-    db = await get_main_db()
-    await db.execute(
-        """INSERT INTO habit_records (mac, habit_name, date, completed, created_at)
-           VALUES (?, ?, ?, 1, ?)
-           ON CONFLICT(mac, habit_name, date) DO UPDATE SET completed = 1""",
-        (mac, habit_name, date, now.isoformat()),
-    )
-    await db.commit()
+    async with _write_txn() as db:
+        await db.execute(
+            """INSERT INTO habit_records (mac, habit_name, date, completed, created_at)
+               VALUES (?, ?, ?, 1, ?)
+               ON CONFLICT(mac, habit_name, date) DO UPDATE SET completed = 1""",
+            (mac, habit_name, date, now.isoformat()),
+        )
 
 
 async def get_habit_status(mac: str) -> list[dict]:
@@ -500,7 +625,7 @@ async def get_habit_status(mac: str) -> list[dict]:
     now = datetime.now()
     week_start = (now - timedelta(days=now.weekday())).strftime("%Y-%m-%d")
     today = now.strftime("%Y-%m-%d")
-    db = await get_main_db()
+    db = await _get_db()
     cursor = await db.execute(
         """SELECT DISTINCT habit_name FROM habit_records
            WHERE mac = ? ORDER BY habit_name""",
@@ -536,10 +661,9 @@ async def get_habit_status(mac: str) -> list[dict]:
 
 async def delete_habit(mac: str, habit_name: str) -> bool:
     """Delete all records for a specific habit."""
-    db = await get_main_db()
-    cursor = await db.execute(
-        "DELETE FROM habit_records WHERE mac = ? AND habit_name = ?",
-        (mac, habit_name),
-    )
-    await db.commit()
-    return cursor.rowcount > 0
+    async with _write_txn() as db:
+        cursor = await db.execute(
+            "DELETE FROM habit_records WHERE mac = ? AND habit_name = ?",
+            (mac, habit_name),
+        )
+        return cursor.rowcount > 0
@@ -14,6 +14,15 @@ os.environ.setdefault("DASHSCOPE_API_KEY", "sk-test-dummy-key-001")
 os.environ.setdefault("MOONSHOT_API_KEY", "sk-test-dummy-key-002")
 
 
+@pytest.fixture(autouse=True)
+async def close_stats_connection():
+    """Close the stats connection opened on each test's event loop."""
+    yield
+    from core.stats_store import close_stats_db
+
+    await close_stats_db()
+
+
 @pytest.fixture
 def sample_config():
     """A typical device configuration dict."""
@@ -49,3 +49,30 @@ async def test_delete_nonexistent():
     await init_stats_db()
     deleted = await delete_habit("AA:BB:CC:DD:EE:FF", "Nonexistent")
     assert deleted is False
+
+
+@pytest.mark.asyncio
+async def test_stats_connection_is_reused():
+    from core import db as db_mod
+    from core import stats_store
+
+    await init_stats_db()
+    first = await stats_store._get_db()
+    await check_habit("AA:BB:CC:DD:EE:FF", "Read", "2026-02-28")
+    assert await stats_store._get_db() is first
+
+    await db_mod.close_all()
+    reopened = await stats_store._get_db()
+    assert reopened is not first
+    assert await get_habit_status("AA:BB:CC:DD:EE:FF")
+
+
+@pytest.mark.asyncio
+async def test_stats_connection_pragmas():
+    from core import stats_store
+
+    db = await stats_store._get_db()
+    cursor = await db.execute("PRAGMA journal_mode")
+    assert (await cursor.fetchone())[0] == "wal"
+    cursor = await db.execute("PRAGMA synchronous")
+    assert (await cursor.fetchone())[0] == 1
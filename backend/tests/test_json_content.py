@@ -370,3 +370,59 @@ if __name__ == "__main__":
     test_apply_post_process_no_rules()
     test_apply_post_process_skips_non_string()
     print("✓ All JSON content tests passed")
+
+
+@pytest.mark.asyncio
+async def test_prefetch_images_fetches_all_fields_and_skips_failures():
+    import httpx
+    from unittest.mock import MagicMock
+    from core.json_content import _prefetch_images
+
+    mode_def = {"layout": {"body": [
+        {"type": "image", "field": "hero"},
+        {"type": "two_column", "left": [{"type": "image", "field": "thumb"}], "right": []},
+        {"type": "image", "field": "broken"},
+    ]}}
+    content = {
+        "hero": "https://example.com/hero.png",
+        "thumb": "https://example.com/thumb.png",
+        "broken": "https://example.com/broken.png",
+    }
+
+    async def fake_get(url):
+        if "broken" in url:
+            raise httpx.ConnectError("boom")
+        return MagicMock(status_code=200, content=url.encode())
+
+    instance = MagicMock()
+    instance.get = AsyncMock(side_effect=fake_get)
+    with patch("core.json_content._prefetch_client", return_value=instance):
+        result = await _prefetch_images(content, mode_def)
+
+    assert instance.get.await_count == 3
+    assert result["_prefetched_hero"] == b"https://example.com/hero.png"
+    assert result["_prefetched_thumb"] == b"https://example.com/thumb.png"
+    assert "_prefetched_broken" not in result
+
+
+@pytest.mark.asyncio
+async def test_prefetch_client_is_reused_within_event_loop():
+    from core.json_content import _prefetch_client
+
+    client = _prefetch_client()
+    try:
+        assert _prefetch_client() is client
+    finally:
+        await client.aclose()
+    assert _prefetch_client() is not client
+    await _prefetch_client().aclose()
+
+
+@pytest.mark.asyncio
+async def test_close_prefetch_clients_closes_loop_client():
+    from core.json_content import _prefetch_client, close_prefetch_clients
+
+    client = _prefetch_client()
+    await close_prefetch_clients()
+    assert client.is_closed
+    await close_prefetch_clients()
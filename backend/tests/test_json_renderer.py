@@ -53,6 +53,18 @@ def test_render_centered_text():
     assert img.size == (SCREEN_W, SCREEN_H)
 
 
+def test_render_centered_text_shrinks_to_fit_body():
+    from PIL import ImageDraw
+    from core.json_renderer import _render_centered_text
+    img = Image.new("1", (SCREEN_W, SCREEN_H), 1)
+    ctx = RenderContext(draw=ImageDraw.Draw(img), img=img, content={"text": "静水流深，" * 40}, y=36)
+    body_top = ctx.y
+    _render_centered_text(
+        ctx, {"type": "centered_text", "field": "text", "font_size": 28}, use_full_body=True,
+    )
+    assert body_top < ctx.y <= ctx.footer_top + 4
+
+
 def test_render_text_block():
     mode_def = _make_mode_def([
         {"type": "spacer", "height": 20},
@@ -139,6 +151,25 @@ def test_render_list_with_strings():
     assert img.size == (SCREEN_W, SCREEN_H)
 
 
+def test_render_list_overflow_stops_at_footer():
+    from PIL import ImageDraw
+    from core.json_renderer import _render_list
+    img = Image.new("1", (SCREEN_W, SCREEN_H), 1)
+    ctx = RenderContext(draw=ImageDraw.Draw(img), img=img, content={"rows": [f"第{i}行" for i in range(30)]})
+    _render_list(ctx, {"type": "list", "field": "rows", "max_items": 30, "item_template": "{_value}", "item_spacing": 20})
+    assert ctx.y <= ctx.footer_top
+    # "+N more" marker is drawn just above the footer
+    assert 0 in set(img.crop((0, ctx.y, SCREEN_W, ctx.footer_top)).getdata())
+
+
+def test_list_item_template_expansion():
+    from core.json_renderer import _PLACEHOLDER_RE, _list_item_expander
+    expand = lambda tmpl, item, idx: _PLACEHOLDER_RE.sub(_list_item_expander(item, idx), tmpl)
+    assert expand("{index}. {name} ({reps})", {"name": "深蹲", "reps": 20}, 1) == "1. 深蹲 (20)"
+    assert expand("{name} {missing}", {"name": "a"}, 1) == "a {missing}"
+    assert expand("- {_value} #{index}", "床前明月光", 3) == "- 床前明月光 #3"
+
+
 def test_render_section_with_icon():
     mode_def = _make_mode_def([
         {"type": "spacer", "height": 14},
@@ -228,6 +259,99 @@ def test_render_icon_text():
     assert img.size == (SCREEN_W, SCREEN_H)
 
 
+def test_render_temp_chart():
+    mode_def = _make_mode_def([
+        {"type": "spacer", "height": 30},
+        {"type": "temp_chart", "field": "forecast", "height": 50},
+    ], footer={"label": "TEST", "attribution_template": ""})
+    mode_def["layout"]["body_align"] = "top"
+    forecast = [
+        {"day": "周一", "temp_max": 18, "temp_min": 9},
+        {"day": "周二", "temp_max": 21, "temp_min": 11},
+        {"day": "周三", "temp_max": 16, "temp_min": 7},
+    ]
+    img = render_json_mode(
+        mode_def, {"forecast": forecast},
+        date_str="2月18日", weather_str="晴", battery_pct=80,
+    )
+    assert img.size == (SCREEN_W, SCREEN_H)
+    # Chart area between status bar and footer contains ink
+    assert 0 in set(img.crop((0, 80, SCREEN_W, 200)).getdata())
+
+
+def test_block_renderers_registered_at_import():
+    from PIL import ImageDraw
+    from core.json_renderer import _BLOCK_RENDERERS, _render_block
+    for btype in ("centered_text", "text", "list", "two_column", "image", "temp_chart", "timetable_grid"):
+        assert callable(_BLOCK_RENDERERS[btype])
+    img = Image.new("1", (SCREEN_W, SCREEN_H), 1)
+    ctx = RenderContext(draw=ImageDraw.Draw(img), img=img, content={})
+    y_before = ctx.y
+    _render_block(ctx, {"type": "no_such_block"})
+    assert ctx.y == y_before
+
+
+def test_render_block_skips_when_past_footer():
+    from PIL import ImageDraw
+    from core.json_renderer import _render_block
+    img = Image.new("1", (SCREEN_W, SCREEN_H), 1)
+    ctx = RenderContext(draw=ImageDraw.Draw(img), img=img, content={"t": "below the fold"})
+    ctx.y = ctx.footer_top - 5
+    before = img.tobytes()
+    _render_block(ctx, {"type": "vertical_stack", "children": [
+        {"type": "text", "field": "t"},
+        {"type": "separator"},
+    ]})
+    assert ctx.y == ctx.footer_top - 5
+    assert img.tobytes() == before
+
+
+def test_render_block_skips_blocks_with_empty_field(monkeypatch):
+    from PIL import ImageDraw
+    from core import json_renderer
+
+    calls = []
+    monkeypatch.setitem(json_renderer._BLOCK_RENDERERS, "text", lambda ctx, block: calls.append(block))
+    img = Image.new("1", (SCREEN_W, SCREEN_H), 1)
+    ctx = RenderContext(draw=ImageDraw.Draw(img), img=img, content={"notes": "", "count": 0})
+    json_renderer._render_block(ctx, {"type": "text", "field": "notes"})
+    json_renderer._render_block(ctx, {"type": "text", "field": "missing"})
+    assert calls == []
+    json_renderer._render_block(ctx, {"type": "text", "field": "count"})
+    json_renderer._render_block(ctx, {"type": "text", "template": "hi"})
+    assert len(calls) == 2
+
+
+def test_scaled_weather_icon_is_cached_per_size():
+    from core.json_renderer import _scaled_weather_icon
+    icon = _scaled_weather_icon(0, 36)
+    if icon is None:
+        return
+    assert icon.size == (36, 36)
+    assert _scaled_weather_icon(0, 36) is icon
+
+
+def test_vertical_stack_spaces_every_child_until_footer():
+    from PIL import ImageDraw
+    from core.json_renderer import _render_block
+    img = Image.new("1", (SCREEN_W, SCREEN_H), 1)
+    ctx = RenderContext(draw=ImageDraw.Draw(img), img=img, content={})
+    y_start = ctx.y
+    _render_block(ctx, {"type": "vertical_stack", "spacing": 7, "children": [
+        {"type": "text", "field": "missing"},
+        {"type": "spacer", "height": 10},
+        {"type": "text", "field": "missing"},
+    ]})
+    assert ctx.y == y_start + 10 + 3 * 7
+
+    ctx.y = ctx.footer_top - 12
+    _render_block(ctx, {"type": "vertical_stack", "spacing": 7, "children": [
+        {"type": "spacer", "height": 5},
+        {"type": "spacer", "height": 5},
+    ]})
+    assert ctx.y == ctx.footer_top - 12 + 5 + 7
+
+
 def test_render_with_footer_template():
     mode_def = _make_mode_def(
         [{"type": "centered_text", "field": "quote", "font_size": 16}],
@@ -266,6 +390,56 @@ def test_render_image_block_preserves_palette_colors():
     assert 2 in palette_indexes
 
 
+def test_convert_image_block_mono_thresholds_without_dither():
+    from core.json_renderer import _convert_image_block
+    for src in (Image.new("L", (8, 8), 100), Image.new("RGBA", (8, 8), (100, 100, 100, 255))):
+        mono = _convert_image_block(src, 16, 16, 2, dither=False)
+        assert mono.mode == "1"
+        assert mono.size == (16, 16)
+        assert set(mono.getdata()) == {0}
+    light = _convert_image_block(Image.new("RGB", (8, 8), (200, 200, 200)), 16, 16, 2, dither=False)
+    assert set(light.getdata()) == {255}
+
+
+def test_convert_image_block_decodes_large_jpeg_at_reduced_scale():
+    from core.json_renderer import _convert_image_block
+    buf = BytesIO()
+    Image.new("RGB", (1600, 1200), (30, 30, 30)).save(buf, format="JPEG")
+    src = Image.open(BytesIO(buf.getvalue()))
+    mono = _convert_image_block(src, 200, 150, 2, dither=False)
+    assert src.size == (200, 150)  # drafted to 1/8 scale before decoding
+    assert mono.size == (200, 150)
+    assert set(mono.getdata()) == {0}
+
+
+def test_convert_image_block_reduces_large_png_sources():
+    from core.json_renderer import _convert_image_block
+    half = Image.new("L", (1200, 600), 0)
+    half.paste(255, (600, 0, 1200, 600))
+    for src in (half, half.convert("RGBA")):
+        out = _convert_image_block(src, 100, 50, 2)
+        assert out.size == (100, 50)
+        assert out.getpixel((10, 25)) == 0
+        assert out.getpixel((90, 25)) == 255
+
+
+def test_convert_image_block_mono_dithers_by_default():
+    from core.json_renderer import _convert_image_block
+    for src in (Image.new("L", (8, 8), 100), Image.new("RGBA", (8, 8), (100, 100, 100, 255))):
+        mono = _convert_image_block(src, 16, 16, 2)
+        assert set(mono.getdata()) == {0, 255}
+
+
+def test_image_client_is_reused_per_trust_env():
+    from core import json_renderer
+    first = json_renderer._image_client(True, json_renderer._IMAGE_FETCH_ATTEMPTS[0]["timeout"])
+    again = json_renderer._image_client(True, json_renderer._IMAGE_FETCH_ATTEMPTS[0]["timeout"])
+    other = json_renderer._image_client(False, json_renderer._IMAGE_FETCH_ATTEMPTS[1]["timeout"])
+    assert first is again
+    assert first is not other
+    assert other.trust_env is False
+
+
 def test_builtin_footer_localization():
     assert _localized_footer_label("COUNTDOWN", "COUNTDOWN", "zh") == "倒计时"
     assert _localized_footer_label("COUNTDOWN", "Countdown", "en") == "Countdown"
@@ -375,6 +549,104 @@ def test_render_poetry_json():
     assert img.size == (SCREEN_W, SCREEN_H)
 
 
+def test_render_json_mode_reuses_frame_for_identical_inputs():
+    from unittest.mock import patch
+    from core import json_renderer
+
+    mode_def = _make_mode_def([{"type": "text", "field": "quote"}])
+    kwargs = dict(date_str="3月1日", weather_str="晴", battery_pct=90)
+    content = {"quote": "memo check", "_prefetched_image_url": b"\x00\x01"}
+    first = render_json_mode(mode_def, content, **kwargs)
+    with patch.object(json_renderer, "_render_json_mode", wraps=json_renderer._render_json_mode) as spy:
+        again = render_json_mode(mode_def, dict(content), **kwargs)
+        assert spy.call_count == 0
+        render_json_mode(mode_def, content, **{**kwargs, "battery_pct": 50})
+        assert spy.call_count == 1
+    assert again is not first
+    assert again.tobytes() == first.tobytes()
+
+
+def test_render_json_mode_memo_tracks_content_changes():
+    from unittest.mock import patch
+    from core import json_renderer
+
+    mode_def = _make_mode_def([{"type": "text", "field": "quote"}])
+    kwargs = dict(date_str="3月2日", weather_str="晴", battery_pct=90)
+    content = {"quote": "first", "items": ["a"]}
+    render_json_mode(mode_def, content, **kwargs)
+    content["items"].append("b")
+    with patch.object(json_renderer, "_render_json_mode", wraps=json_renderer._render_json_mode) as spy:
+        render_json_mode(mode_def, content, **kwargs)
+        render_json_mode(mode_def, {"quote": "second", "items": ["a", "b"]}, **kwargs)
+        assert spy.call_count == 2
+
+
+def test_render_json_mode_does_not_memoize_image_placeholder():
+    import httpx
+    from unittest.mock import MagicMock, patch
+    from core import json_renderer
+
+    mode_def = _make_mode_def([{"type": "image", "field": "image_url"}])
+    kwargs = dict(date_str="3月3日", weather_str="晴", battery_pct=90)
+    content = {"image_url": "https://example.invalid/a.png"}
+    failing = MagicMock()
+    failing.get.side_effect = httpx.ConnectError("down")
+    with patch.object(json_renderer, "_image_client", return_value=failing), \
+         patch.object(json_renderer, "_render_json_mode", wraps=json_renderer._render_json_mode) as spy:
+        render_json_mode(mode_def, content, **kwargs)
+        render_json_mode(mode_def, content, **kwargs)
+        assert spy.call_count == 2
+
+
+def test_render_json_mode_memo_keys_on_status_bar_hour():
+    from datetime import datetime
+    from unittest.mock import patch
+    from core import json_renderer
+    from core.patterns import utils
+
+    mode_def = _make_mode_def([{"type": "text", "field": "quote"}])
+    kwargs = dict(date_str="3月4日", weather_str="晴", battery_pct=90)
+    content = {"quote": "hour check"}
+    with patch.object(json_renderer, "_render_json_mode", wraps=json_renderer._render_json_mode) as spy:
+        render_json_mode(mode_def, content, time_str="09:15:01", **kwargs)
+        render_json_mode(mode_def, content, time_str="09:15:02", **kwargs)
+        assert spy.call_count == 1
+        with patch.object(utils, "datetime") as fake_dt:
+            fake_dt.now.return_value = datetime(2026, 3, 4, 9, 0)
+            morning = render_json_mode(mode_def, content, **kwargs)
+            fake_dt.now.return_value = datetime(2026, 3, 4, 15, 0)
+            afternoon = render_json_mode(mode_def, content, **kwargs)
+        assert spy.call_count == 2
+    assert morning.tobytes() != afternoon.tobytes()
+
+
+def test_list_marks_overflow_when_stopped_by_footer_guard():
+    from PIL import ImageDraw
+    from core.json_renderer import _render_list
+    img = Image.new("1", (SCREEN_W, SCREEN_H), 1)
+    ctx = RenderContext(draw=ImageDraw.Draw(img), img=img, content={"items": ["a", "b"]})
+    ctx.y = ctx.footer_top - 10
+    before = img.tobytes()
+    _render_list(ctx, {"type": "list", "field": "items", "item_spacing": 8})
+    assert img.tobytes() != before  # "+2 more" drawn
+
+
+def test_centered_text_balanced_wrap_is_opt_in():
+    from unittest.mock import patch
+    from PIL import ImageDraw
+    from core import json_renderer
+    content = {"quote": "The quick brown fox jumps over the lazy dog near the river"}
+    with patch.object(json_renderer, "wrap_text_balanced", wraps=json_renderer.wrap_text_balanced) as spy:
+        for wrap in (None, "greedy", "balanced"):
+            img = Image.new("1", (SCREEN_W, SCREEN_H), 1)
+            ctx = RenderContext(draw=ImageDraw.Draw(img), img=img, content=content)
+            block = {"type": "centered_text", "field": "quote"}
+            if wrap:
+                block["wrap"] = wrap
+            json_renderer._render_centered_text(ctx, block)
+            assert spy.called == (wrap == "balanced")
+
+
 if __name__ == "__main__":
     test_render_produces_correct_size_image()
     test_render_centered_text()
@@ -0,0 +1,102 @@
+"""
+测试 AI 模式生成器的提示词结构与结果缓存
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from core import mode_generator
+from core.mode_generator import (
+    _META_PROMPT,
+    _build_generation_prompt,
+    _build_messages,
+    _call_llm_with_messages,
+    generate_mode_definition,
+)
+
+
+def test_messages_share_static_system_prefix():
+    a = _build_messages(_build_generation_prompt("番茄钟"))
+    b = _build_messages(_build_generation_prompt("每日单词"))
+    assert a[0] == b[0] == {"role": "system", "content": _META_PROMPT}
+    assert "番茄钟" in a[1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_generate_mode_definition_caches_validated_result(monkeypatch):
+    monkeypatch.setattr(mode_generator, "_generation_cache", {})
+    with patch("core.mode_generator._call_llm_with_messages", new_callable=AsyncMock) as mock_llm:
+        mock_llm.return_value = mode_generator._ZEN_EXAMPLE
+        first = await generate_mode_definition("一个禅意模式", cache_scope="1")
+        second = await generate_mode_definition("  一个禅意模式 ", cache_scope="1")
+        other_model = await generate_mode_definition(
+            "一个禅意模式", model="deepseek-reasoner", cache_scope="1"
+        )
+
+    assert first["ok"] and second["ok"] and other_model["ok"]
+    assert second["mode_def"] == first["mode_def"]
+    assert second["mode_def"] is not first["mode_def"]
+    assert mock_llm.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_mode_definition_cache_is_scoped(monkeypatch):
+    monkeypatch.setattr(mode_generator, "_generation_cache", {})
+    with patch("core.mode_generator._call_llm_with_messages", new_callable=AsyncMock) as mock_llm:
+        mock_llm.return_value = mode_generator._ZEN_EXAMPLE
+        await generate_mode_definition("一个禅意模式", cache_scope="1")
+        await generate_mode_definition("一个禅意模式", cache_scope="2")
+        await generate_mode_definition("一个禅意模式", cache_scope="1", api_key="sk-user")
+        await generate_mode_definition("一个禅意模式", cache_scope="1", regenerate=True)
+        await generate_mode_definition("一个禅意模式")
+        await generate_mode_definition("一个禅意模式")
+
+    assert mock_llm.await_count == 6
+
+
+def test_auto_fix_sanitizes_mode_id():
+    fixed = mode_generator._auto_fix({"mode_id": "my-模式 1", "content": {}, "layout": {"body": [{}]}})
+    assert fixed["mode_id"] == "MY____1"
+
+
+def test_image_generation_intent_detection():
+    assert mode_generator._is_image_generation_request("生成一张水墨海报")
+    assert mode_generator._is_image_generation_request("Generate an IMAGE of cats")
+    assert not mode_generator._is_image_generation_request("番茄钟计时")
+    assert not mode_generator._is_image_generation_request(None)
+
+
+def test_supports_vision_matches_provider_model_pairs():
+    assert mode_generator._supports_vision("aliyun", "qwen-vl-max")
+    assert not mode_generator._supports_vision("deepseek", "qwen-vl-max")
+    assert not mode_generator._supports_vision("aliyun", "qwen-max")
+
+
+class _FakeStream:
+    def __init__(self, pieces):
+        self._pieces = pieces
+        self.consumed = 0
+        self.response = SimpleNamespace(aclose=AsyncMock())
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for piece in self._pieces:
+            self.consumed += 1
+            delta = SimpleNamespace(content=piece)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=None)])
+
+
+@pytest.mark.asyncio
+async def test_call_llm_stops_streaming_once_json_closes():
+    stream = _FakeStream(['```json\n{"mode_id": "A", ', '"t": "{x}"}', "\n```\n", "Explanation..."])
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=stream)
+    with patch("core.mode_generator._get_client", return_value=(client, 1024)):
+        text = await _call_llm_with_messages("deepseek", "deepseek-chat", [{"role": "user", "content": "x"}])
+
+    assert text == '```json\n{"mode_id": "A", "t": "{x}"}'
+    assert stream.consumed == 2
+    stream.response.aclose.assert_awaited_once()
+    assert client.chat.completions.create.call_args.kwargs["stream"] is True
@@ -59,6 +59,11 @@ def test_validate_invalid_content_type():
     assert _validate_mode_def(bad) is False
 
 
+def test_validate_unhashable_content_type():
+    bad = {**SAMPLE_MODE_DEF, "content": {**SAMPLE_MODE_DEF["content"], "type": ["llm"]}}
+    assert _validate_mode_def(bad) is False
+
+
 def test_validate_llm_without_prompt():
     bad = {
         **SAMPLE_MODE_DEF,
@@ -161,6 +166,35 @@ def test_registry_load_directory():
             assert reg.is_supported(f"DIR_TEST_{i}")
 
 
+def test_registry_load_directory_keeps_order_and_skips_bad_files():
+    reg = ModeRegistry()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name in ("b", "a", "c"):
+            mode_def = {**SAMPLE_MODE_DEF, "mode_id": f"ORDER_{name.upper()}"}
+            with open(os.path.join(tmpdir, f"{name}.json"), "w", encoding="utf-8") as f:
+                json.dump(mode_def, f)
+        with open(os.path.join(tmpdir, "broken.json"), "w", encoding="utf-8") as f:
+            f.write("{not json")
+        with open(os.path.join(tmpdir, "latin1.json"), "wb") as f:
+            f.write(b'{"mode_id": "\xe9"}')
+        with open(os.path.join(tmpdir, "notes.txt"), "w", encoding="utf-8") as f:
+            f.write("ignored")
+
+        loaded = reg.load_directory(tmpdir)
+        assert loaded == ["ORDER_A", "ORDER_B", "ORDER_C"]
+
+
+def test_registry_queries_accept_any_case():
+    reg = ModeRegistry()
+    reg.load_custom_mode_from_dict("case_test", {**SAMPLE_MODE_DEF, "mode_id": "CASE_TEST"})
+    for mid in ("CASE_TEST", "case_test", "Case_Test"):
+        assert reg.is_supported(mid)
+        assert reg.is_json_mode(mid)
+        assert reg.get_json_mode(mid) is not None
+        assert reg.get_mode_info(mid).mode_id == "CASE_TEST"
+
+
 def test_registry_unregister_custom():
     reg = ModeRegistry()
 
@@ -260,6 +294,21 @@ def test_registry_mode_icon_map():
     assert icon_map["ICON_TEST"] == "book"
 
 
+def test_registry_derived_views_refresh_after_changes():
+    reg = ModeRegistry()
+    reg.load_custom_mode_from_dict("MEMO_TEST", {**SAMPLE_MODE_DEF, "mode_id": "MEMO_TEST", "icon": "zen"})
+
+    icon_map = reg.get_mode_icon_map()
+    assert reg.get_mode_icon_map() is icon_map
+    assert icon_map["MEMO_TEST"] == "zen"
+    assert "MEMO_TEST" in reg.get_supported_ids()
+
+    assert reg.unregister_custom("MEMO_TEST")
+    assert "MEMO_TEST" not in reg.get_mode_icon_map()
+    assert "MEMO_TEST" not in reg.get_supported_ids()
+    assert "MEMO_TEST" not in reg.get_cacheable_ids()
+
+
 if __name__ == "__main__":
     test_validate_valid_mode()
     test_validate_missing_mode_id()
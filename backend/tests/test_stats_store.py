@@ -0,0 +1,194 @@
+"""Tests for render/heartbeat statistics aggregation."""
+from unittest.mock import patch
+
+import aiosqlite
+import pytest
+from core import stats_store
+from core.stats_store import (
+    get_device_stats,
+    get_stats_overview,
+    init_stats_db,
+    get_content_history,
+    log_heartbeat,
+    log_render,
+    save_render_content,
+)
+
+
+@pytest.fixture(autouse=True)
+async def isolate_stats_db(tmp_path):
+    """Use an isolated DB file per test and reset shared connections."""
+    from core import db as db_mod
+
+    test_db = str(tmp_path / "stats_test.db")
+    await db_mod.close_all()
+
+    with patch.object(db_mod, "_MAIN_DB_PATH", test_db), \
+         patch("core.stats_store.DB_PATH", test_db):
+        await init_stats_db()
+        yield
+
+    await db_mod.close_all()
+
+
+@pytest.mark.asyncio
+async def test_device_stats_aggregates():
+    mac = "AA:BB:CC:DD:EE:FF"
+    await log_render(mac, "STOIC", cache_hit=True, render_time_ms=100)
+    await log_render(mac, "STOIC", cache_hit=False, render_time_ms=300)
+    await log_render(mac, "ZEN", cache_hit=False, render_time_ms=900, status="error")
+    await log_render("11:22:33:44:55:66", "ZEN", cache_hit=True, render_time_ms=50)
+    await log_heartbeat(mac, 3.9, -60)
+    await log_heartbeat(mac, 3.8, -61)
+
+    stats = await get_device_stats(mac)
+    assert stats["total_renders"] == 3
+    assert stats["cache_hit_rate"] == 33.3
+    assert stats["error_count"] == 1
+    assert stats["avg_render_time_ms"] == 200
+    assert stats["mode_frequency"] == {"STOIC": 2, "ZEN": 1}
+    assert stats["last_render"]["persona"] == "ZEN"
+    assert [h["voltage"] for h in stats["heartbeats"]] == [3.9, 3.8]
+    assert sum(d["count"] for d in stats["daily_renders"]) == 3
+
+    overview = await get_stats_overview()
+    assert overview["total_devices"] == 2
+    assert overview["total_renders"] == 4
+    assert overview["cache_hit_rate"] == 50.0
+    assert overview["mode_frequency"] == {"STOIC": 2, "ZEN": 2}
+    assert len(overview["devices"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_device_stats_empty():
+    stats = await get_device_stats("AA:BB:CC:DD:EE:FF")
+    assert stats["total_renders"] == 0
+    assert stats["cache_hit_rate"] == 0
+    assert stats["error_count"] == 0
+    assert stats["avg_render_time_ms"] == 0
+    assert stats["last_render"] is None
+    assert stats["heartbeats"] == []
+
+    overview = await get_stats_overview()
+    assert overview["total_devices"] == 0
+    assert overview["cache_hit_rate"] == 0
+
+
+@pytest.mark.asyncio
+async def test_retention_pruned_periodically():
+    from core import stats_store
+
+    mac = "AA:BB:CC:DD:EE:FF"
+    with patch.object(stats_store, "_HEARTBEAT_RETENTION", 3), \
+         patch.object(stats_store, "_CONTENT_HISTORY_RETENTION", 2), \
+         patch.object(stats_store, "_PRUNE_EVERY", 4), \
+         patch.dict(stats_store._prune_counters, clear=True):
+        for i in range(6):
+            await log_heartbeat(mac, 3.0 + i / 10, -50)
+            await save_render_content(mac, "STOIC", {"quote": str(i)})
+
+        db = await stats_store._get_db()
+        rows = await db.execute_fetchall(
+            "SELECT COUNT(*) FROM device_heartbeats WHERE mac = ?", (mac,)
+        )
+        # Pruned on writes 1 and 5, then one more heartbeat was added
+        assert rows[0][0] == 4
+        history = await get_content_history(mac)
+        assert [h["content"]["quote"] for h in history] == ["5", "4", "3"]
+
+
+@pytest.mark.asyncio
+async def test_render_logs_written_behind_in_batches():
+    import asyncio
+
+    from core import stats_store
+
+    mac = "AA:BB:CC:DD:EE:FF"
+    db = await stats_store._get_db()
+
+    async def _count() -> int:
+        rows = await db.execute_fetchall("SELECT COUNT(*) FROM render_logs")
+        return rows[0][0]
+
+    with patch.object(stats_store, "_RENDER_LOG_BATCH", 3), \
+         patch.object(stats_store, "_RENDER_LOG_FLUSH_DELAY", 0.01):
+        await log_render(mac, "STOIC", cache_hit=False, render_time_ms=10)
+        await log_render(mac, "STOIC", cache_hit=False, render_time_ms=10)
+        assert await _count() == 0
+        await log_render(mac, "STOIC", cache_hit=False, render_time_ms=10)
+        assert await _count() == 3
+
+        await log_render(mac, "ZEN", cache_hit=False, render_time_ms=10)
+        await asyncio.sleep(0.05)
+        assert await _count() == 4
+
+        await log_render(mac, "ZEN", cache_hit=False, render_time_ms=10)
+        assert (await get_device_stats(mac))["total_renders"] == 5
+
+
+@pytest.mark.asyncio
+async def test_recent_rows_read_from_composite_index():
+    from core import stats_store
+
+    db = await stats_store._get_db()
+    plan = await db.execute_fetchall(
+        """EXPLAIN QUERY PLAN
+           SELECT battery_voltage FROM device_heartbeats
+           WHERE mac = ? ORDER BY created_at DESC LIMIT 30""",
+        ("AA:BB:CC:DD:EE:FF",),
+    )
+    details = " ".join(row[3] for row in plan)
+    assert "idx_heartbeats_mac_created" in details
+    assert "TEMP B-TREE" not in details
+
+
+@pytest.mark.asyncio
+async def test_daily_render_rollup_backfilled_and_maintained():
+    from core import stats_store
+
+    mac = "AA:BB:CC:DD:EE:FF"
+    db = await stats_store._get_db()
+    await db.executemany(
+        """INSERT INTO render_logs (mac, persona, created_at) VALUES (?, 'STOIC', ?)""",
+        [
+            (mac, "2026-01-01T08:00:00"),
+            (mac, "2026-01-01T09:00:00"),
+            (mac, "2026-01-02T08:00:00"),
+        ],
+    )
+    await db.commit()
+    await init_stats_db()
+
+    await log_render(mac, "ZEN", cache_hit=False, render_time_ms=10)
+    stats = await get_device_stats(mac)
+    assert stats["daily_renders"][:2] == [
+        {"date": "2026-01-01", "count": 2},
+        {"date": "2026-01-02", "count": 1},
+    ]
+    assert stats["daily_renders"][-1]["count"] == 1
+    assert sum(d["count"] for d in stats["daily_renders"]) == stats["total_renders"] == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_write_rolls_back_transaction():
+    with pytest.raises(aiosqlite.OperationalError):
+        async with stats_store._write_txn() as db:
+            await db.execute(
+                "INSERT INTO device_heartbeats (mac, battery_voltage, created_at) VALUES (?, ?, ?)",
+                ("AA:BB:CC:DD:EE:FF", 3.7, "2026-03-01T00:00:00"),
+            )
+            await db.execute("INSERT INTO missing_table VALUES (1)")
+
+    db = await stats_store._get_db()
+    assert not db.in_transaction
+    await log_heartbeat("11:22:33:44:55:66", 3.9, -60)
+    stats = await get_device_stats("AA:BB:CC:DD:EE:FF")
+    assert stats["heartbeats"] == []
+
+
+@pytest.mark.asyncio
+async def test_close_stats_db_closes_loop_connection():
+    db = await stats_store._get_db()
+    await stats_store.close_stats_db()
+    assert db.closed
+    assert await stats_store._get_db() is not db
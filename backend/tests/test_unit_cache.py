@@ -131,6 +131,26 @@ class TestContentCache:
         assert cache._db_disabled_until is not None
 
 
+    @pytest.mark.asyncio
+    async def test_generate_all_modes_fetches_weather_once_per_location(self, cache):
+        config = {
+            "modes": ["STOIC", "ROAST", "ZEN"],
+            "city": "杭州",
+            "mode_overrides": {"ZEN": {"city": "北京"}},
+        }
+        weather = {"temp": 20, "weather_code": 0, "weather_str": "20°C"}
+        with patch("core.cache.get_date_context", new_callable=AsyncMock, return_value={}), \
+             patch("core.cache.get_weather", new_callable=AsyncMock, return_value=weather) as mock_weather, \
+             patch("core.cache.generate_and_render", new_callable=AsyncMock,
+                   return_value=(_make_image(), {})) as mock_gar, \
+             patch.object(cache, "_persistent_cache_available", return_value=False):
+            await cache._generate_all_modes("AA:BB:CC:DD:EE:FF", config, ["STOIC", "ROAST", "ZEN"], 3.3)
+
+        assert sorted(c.kwargs["city"] for c in mock_weather.await_args_list) == ["北京", "杭州"]
+        assert mock_gar.await_count == 3
+        assert all(c.args[3] == weather for c in mock_gar.await_args_list)
+
+
 class TestGenerateSingleMode:
     """Test the single-mode generation wrapper."""
 
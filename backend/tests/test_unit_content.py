@@ -396,3 +396,57 @@ class TestRecipeAndArtwallFallbacks:
         assert result["image_url"] == ""
         assert "黑、白、红、黄" in result["prompt"]
         assert result["description"] == "彩色极简插画"
+
+
+class TestSharedLLMClient:
+    @pytest.mark.asyncio
+    async def test_client_reused_per_key_and_endpoint(self):
+        from core.content import _get_client
+
+        first, _ = _get_client("deepseek", "deepseek-chat", api_key="sk-test-a")
+        again, _ = _get_client("deepseek", "deepseek-chat", api_key="sk-test-a")
+        other, _ = _get_client("deepseek", "deepseek-chat", api_key="sk-test-b")
+        assert first is again
+        assert other is not first
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_bounded_per_client(self):
+        import asyncio
+
+        from core import content
+
+        client = MagicMock()
+        in_flight = 0
+        peak = 0
+
+        async def _create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            choice = MagicMock(finish_reason="stop")
+            choice.message.content = "ok"
+            return MagicMock(choices=[choice], usage=MagicMock(total_tokens=1))
+
+        client.chat.completions.create = _create
+        with patch.object(content, "_get_client", return_value=(client, 100)), \
+             patch.object(content, "_LLM_MAX_CONCURRENCY", 2):
+            results = await asyncio.gather(
+                *(content._call_llm("deepseek", "deepseek-chat", "hi") for _ in range(5))
+            )
+        assert results == ["ok"] * 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_evicted_and_remaining_clients_are_closed(self):
+        from core import content
+
+        with patch.object(content, "_LLM_CLIENT_CACHE_SIZE", 1):
+            first = content._shared_openai_client("sk-test-a", "https://a.example")
+            second = content._shared_openai_client("sk-test-b", "https://b.example")
+            with patch.object(first, "close", new_callable=AsyncMock) as close_first, \
+                 patch.object(second, "close", new_callable=AsyncMock) as close_second:
+                await content.close_llm_clients()
+        close_first.assert_awaited_once()
+        close_second.assert_awaited_once()
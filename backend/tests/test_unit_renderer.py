@@ -5,6 +5,8 @@ STOIC, ROAST, ZEN, FITNESS, POETRY are now JSON-defined modes rendered by
 json_renderer.py. Tests for those live in test_json_renderer.py.
 This file tests only the Python builtin modes still dispatched by render_mode().
 """
+import io
+
 import pytest
 from PIL import Image
 
@@ -35,6 +37,12 @@ class TestImageConversion:
         data = image_to_png_bytes(img)
         assert data[:4] == b"\x89PNG"
 
+    def test_png_keeps_1bit_depth(self):
+        img = _make_1bit_image()
+        decoded = Image.open(io.BytesIO(image_to_png_bytes(img)))
+        assert decoded.mode == "1"
+        assert decoded.tobytes() == img.tobytes()
+
 
 class TestRenderMode:
     """render_mode is legacy; all modes are JSON-defined."""
@@ -60,3 +68,141 @@ class TestRenderMode:
                 {"quote": "Test", "author": "Author"},
                 **self.COMMON_KWARGS,
             )
+
+
+class TestRenderError:
+    def test_scaffold_is_not_modified_between_renders(self):
+        from core.renderer import render_error
+
+        first = render_error(mac="AA:AA", screen_w=296, screen_h=128)
+        second = render_error(mac="BB:BB", screen_w=296, screen_h=128)
+        assert first.size == (296, 128)
+        assert first.tobytes() != second.tobytes()
+        assert render_error(mac="AA:AA", screen_w=296, screen_h=128).tobytes() == first.tobytes()
+
+
+class TestFontHelpers:
+    def test_load_font_is_memoized(self):
+        from core.patterns.utils import load_font
+
+        assert load_font("noto_serif_light", 14) is load_font("noto_serif_light", 14)
+
+    def test_load_font_by_name_is_memoized(self):
+        from core.patterns.utils import load_font_by_name
+
+        assert load_font_by_name("NotoSerifSC-Light.ttf", 22) is load_font_by_name("NotoSerifSC-Light.ttf", 22)
+
+    def test_load_icon_returns_independent_copies(self):
+        from core.patterns.utils import load_icon
+
+        first = load_icon("book", size=(12, 12))
+        if first is None:
+            pytest.skip("icons not installed")
+        second = load_icon("book", size=[12, 12])
+        assert first is not second
+        assert first.tobytes() == second.tobytes()
+
+    def test_text_bbox_matches_getbbox(self):
+        from core.patterns.utils import load_font, text_bbox
+
+        font = load_font("noto_serif_regular", 14)
+        assert text_bbox(font, "重要日子") == font.getbbox("重要日子")
+        assert text_bbox(font, "重要日子") is text_bbox(font, "重要日子")
+
+    def test_wrap_text_balanced_breaks_on_words_and_fits(self):
+        from core.patterns.utils import load_font, wrap_text_balanced
+
+        font = load_font("noto_serif_light", 20)
+        text = "The quick brown fox jumps over the lazy dog near the quiet river bank"
+        lines = wrap_text_balanced(text, font, 160)
+        assert " ".join(lines) == text
+        assert all(font.getlength(line) <= 160 for line in lines)
+        widths = [font.getlength(line) for line in lines[:-1]]
+        assert max(widths) - min(widths) < 80
+
+    def test_draw_dashed_line_matches_per_segment_lines(self):
+        from PIL import Image, ImageDraw
+        from core.patterns.utils import draw_dashed_line
+
+        for dash_len, gap_len in ((4, 4), (2, 3), (5, 0)):
+            expected = Image.new("1", (120, 6), 1)
+            draw = ImageDraw.Draw(expected)
+            x = 3
+            while x < 101:
+                draw.line([(x, 2), (min(x + dash_len, 101), 2)], fill=0)
+                x += dash_len + gap_len
+            actual = Image.new("1", (120, 6), 1)
+            draw_dashed_line(ImageDraw.Draw(actual), (3, 2), (101, 2), dash_len=dash_len, gap_len=gap_len)
+            assert actual.tobytes() == expected.tobytes()
+
+    def test_rgba_to_mono_thresholds_alpha(self):
+        from PIL import Image
+        from core.patterns.utils import rgba_to_mono
+
+        src = Image.new("RGBA", (3, 1), (0, 0, 0, 0))
+        src.putpixel((1, 0), (255, 255, 255, 128))
+        src.putpixel((2, 0), (255, 255, 255, 129))
+        mono = rgba_to_mono(src)
+        assert mono.mode == "1"
+        assert list(mono.getdata()) == [255, 255, 0]
+
+    def test_wrap_text_is_memoized_but_returns_fresh_lists(self):
+        from core.patterns.utils import _wrap_text_cached, load_font, wrap_text
+
+        font = load_font("noto_serif_light", 14)
+        first = wrap_text("今天也要好好生活\n第二段", font, 60)
+        hits = _wrap_text_cached.cache_info().hits
+        first.append("mutated")
+        second = wrap_text("今天也要好好生活\n第二段", font, 60)
+        assert _wrap_text_cached.cache_info().hits == hits + 1
+        assert "mutated" not in second
+        assert "".join(second) == "今天也要好好生活第二段"
+
+    def test_text_bbox_with_fontmode_matches_draw_textbbox(self):
+        from PIL import Image, ImageDraw
+        from core.patterns.utils import apply_text_fontmode, load_font, text_bbox
+
+        draw = ImageDraw.Draw(Image.new("1", (10, 10)))
+        apply_text_fontmode(draw)
+        font = load_font("inter_medium", 11)
+        assert text_bbox(font, "87%", draw.fontmode) == draw.textbbox((0, 0), "87%", font=font)
+
+    def test_latin_fonts_use_basic_layout(self):
+        from PIL import ImageFont
+        from core.patterns import utils
+
+        font = utils.load_font("inter_medium", 13)
+        if not isinstance(font, ImageFont.FreeTypeFont) or utils._force_bitmap:
+            pytest.skip("TrueType fonts not installed")
+        assert font.layout_engine == ImageFont.Layout.BASIC
+
+    def test_status_bar_bitmap_font_is_memoized(self):
+        from core.patterns.utils import _load_bitmap_font
+
+        assert _load_bitmap_font("NotoSerifSC-Regular", 12) is _load_bitmap_font("NotoSerifSC-Regular", 12)
+
+    def test_wrap_text_keeps_overwide_characters_on_their_own_line(self):
+        from core.patterns.utils import load_font, wrap_text
+
+        font = load_font("noto_serif_light", 14)
+        lines = wrap_text("好好生活ab\n\n天地", font, 3)
+        assert lines == ["好", "好", "生", "活", "a", "b", "天", "地"]
+
+    def test_has_cjk_covers_unified_and_extension_a_blocks(self):
+        from core.patterns.utils import has_cjk
+
+        assert has_cjk("Stay hungry 中")
+        assert has_cjk("㐀") and has_cjk("鿿")
+        assert not has_cjk("Stay hungry, stay foolish.")
+        assert not has_cjk("䷀")  # Yijing hexagram, between the two blocks
+
+    def test_cached_icons_are_fully_decoded(self, tmp_path, monkeypatch):
+        from PIL import Image
+        from core.patterns import utils
+
+        Image.new("1", (8, 8), 0).save(tmp_path / "_mono_probe.png")
+        monkeypatch.setattr(utils, "ICONS_DIR", str(tmp_path))
+        icon = utils._load_icon_cached("_mono_probe", None)
+        utils._load_icon_cached.cache_clear()
+        assert icon.mode == "1"
+        assert getattr(icon, "fp", None) is None